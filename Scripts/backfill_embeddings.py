@@ -1,7 +1,12 @@
+import hashlib
 import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import mysql.connector as mysql
 import numpy as np
+import torch
 from dotenv import load_dotenv
 from sentence_transformers import SentenceTransformer
 from tqdm import tqdm
@@ -19,12 +24,67 @@ DB_CONFIG = {
 }
 
 MODEL_VERSION = "all-mpnet-base-v2"
-FETCH_BATCH_SIZE = 128
+# Embeddings are stored as float16; the suffix tells readers how to decode them
+STORED_MODEL_VERSION = MODEL_VERSION + "|fp16"
+# SentenceTransformer.encode sorts each call's texts by length before batching,
+# so large fetch chunks keep padding waste low across mini-batches.
+FETCH_BATCH_SIZE = 4096
 ENCODE_BATCH_SIZE = 64
+GPU_ENCODE_BATCH_SIZE = 256
+COMMIT_EVERY_BATCHES = 8
+PIPELINE_QUEUE_SIZE = 3
+_SENTINEL = object()
+
+UPSERT_SQL = """
+    INSERT INTO event_embeddings (id, embedding, embedding_model, text_hash)
+    VALUES (%s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        embedding = VALUES(embedding),
+        embedding_model = VALUES(embedding_model),
+        text_hash = VALUES(text_hash)
+"""
+
+
+def load_model():
+    """Load the embedding model on GPU in FP16 when CUDA is available, else CPU."""
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    model = SentenceTransformer(MODEL_VERSION, device=device)
+    if device == "cuda":
+        model.half()
+    return model, device
+
+
+def ensure_text_hash_column(conn) -> None:
+    """Add event_embeddings.text_hash (hash of the embedded text) if it is missing."""
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        SELECT COUNT(*) FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+          AND TABLE_NAME = 'event_embeddings'
+          AND COLUMN_NAME = 'text_hash'
+        """
+    )
+    if cursor.fetchone()[0] == 0:
+        cursor.execute("ALTER TABLE event_embeddings ADD COLUMN text_hash BINARY(16) NULL")
+        conn.commit()
+    cursor.close()
+
+
+def text_hash(text: str) -> bytes:
+    """16-byte content hash of an event's embedding text."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
 
 
 def stream_events(cursor):
-    cursor.execute("SELECT id, title, blurb, description FROM events")
+    # Stored hash and model come along so unchanged rows can be skipped
+    cursor.execute(
+        """
+        SELECT e.id, e.title, e.blurb, e.description, emb.text_hash, emb.embedding_model
+        FROM events e
+        LEFT JOIN event_embeddings emb ON emb.id = e.id
+        """
+    )
     while True:
         rows = cursor.fetchmany(FETCH_BATCH_SIZE)
         if not rows:
@@ -32,43 +92,152 @@ def stream_events(cursor):
         yield rows
 
 
-def main():
-    model = SentenceTransformer(MODEL_VERSION)
-    conn = mysql.connect(**DB_CONFIG)
-    cursor = conn.cursor()
+def _drain(q: queue.Queue) -> None:
+    """
+    Consume ``q`` up to the sentinel so a stopped stage never blocks its producer.
 
-    cursor.execute("SELECT COUNT(*) FROM events")
-    total = cursor.fetchone()[0]
+    Producers check the shared stop flag before each put, so this only takes
+    the batch or two already in flight, not the rest of the table.
+    """
+    while q.get() is not _SENTINEL:
+        pass
 
+
+def fetch_stage(fetch_queue: queue.Queue, stop: threading.Event) -> None:
+    """Stream event rows from MySQL into ``fetch_queue`` on a dedicated connection."""
+    conn = cursor = None
+    try:
+        # Connecting inside the try guarantees the sentinel even if MySQL is unreachable
+        conn = mysql.connect(**DB_CONFIG)
+        cursor = conn.cursor()
+        for batch in stream_events(cursor):
+            if stop.is_set():
+                break
+            fetch_queue.put(batch)
+    except BaseException:
+        stop.set()
+        raise
+    finally:
+        fetch_queue.put(_SENTINEL)
+        if cursor is not None:
+            cursor.close()
+        if conn is not None:
+            conn.close()
+
+
+def encode_stage(model, device, encode_batch_size, fetch_queue: queue.Queue, write_queue: queue.Queue,
+                 stop: threading.Event) -> int:
+    """Encode changed rows and hand (ids, embeddings, hashes) to the writer; returns rows skipped."""
+    skipped = 0
+    try:
+        while True:
+            batch = fetch_queue.get()
+            if batch is _SENTINEL:
+                break
+            if stop.is_set():
+                # Another stage failed: stop encoding and let the fetcher finish
+                _drain(fetch_queue)
+                break
+            event_ids, texts, hashes = [], [], []
+            for event_id, title, blurb, description, stored_hash, stored_model in batch:
+                text = " ".join(filter(None, (title, blurb, description))).strip() or " "
+                digest = text_hash(text)
+                # Same text already embedded with the current model/format
+                if stored_hash is not None and bytes(stored_hash) == digest and stored_model == STORED_MODEL_VERSION:
+                    skipped += 1
+                    continue
+                event_ids.append(event_id)
+                texts.append(text)
+                hashes.append(digest)
+            if not texts:
+                continue
+            # Stored as float16 to halve row size; cosine similarity is unaffected
+            embeddings = model.encode(
+                texts, convert_to_numpy=True, batch_size=encode_batch_size, device=device
+            ).astype(np.float16)
+            write_queue.put((event_ids, embeddings, hashes))
+    except BaseException:
+        stop.set()
+        _drain(fetch_queue)
+        raise
+    finally:
+        write_queue.put(_SENTINEL)
+    return skipped
+
+
+def write_stage(write_queue: queue.Queue, total: int, stop: threading.Event) -> int:
+    """Upsert encoded batches on a dedicated connection; returns rows written."""
+    conn = cursor = None
     processed = 0
-    for batch in stream_events(cursor):
-        texts = [
-            " ".join(filter(None, (title, blurb, description))).strip() or " "
-            for (_, title, blurb, description) in batch
-        ]
-        embeddings = model.encode(
-            texts, convert_to_numpy=True, batch_size=ENCODE_BATCH_SIZE
-        ).astype(np.float32)
-
-        for (event_id, _, _, _), emb in zip(batch, embeddings):
-            cursor.execute(
-                """
-                INSERT INTO event_embeddings (id, embedding, embedding_model)
-                VALUES (%s, %s, %s)
-                ON DUPLICATE KEY UPDATE
-                    embedding = VALUES(embedding),
-                    embedding_model = VALUES(embedding_model)
-                """,
-                (event_id, emb.tobytes(), MODEL_VERSION),
+    batch_num = 0
+    try:
+        # Connecting inside the try lets a failed connect still drain the encoder
+        conn = mysql.connect(**DB_CONFIG)
+        conn.autocommit = False
+        cursor = conn.cursor()
+        while True:
+            item = write_queue.get()
+            if item is _SENTINEL:
+                break
+            event_ids, embeddings, hashes = item
+            # executemany collapses the batch into a single multi-row INSERT
+            cursor.executemany(
+                UPSERT_SQL,
+                [
+                    (event_id, emb.tobytes(), STORED_MODEL_VERSION, digest)
+                    for event_id, emb, digest in zip(event_ids, embeddings, hashes)
+                ],
             )
-
+            batch_num += 1
+            if batch_num % COMMIT_EVERY_BATCHES == 0:
+                conn.commit()
+            processed += len(event_ids)
+            tqdm.write(f"{processed}/{total} events embedded")
         conn.commit()
-        processed += len(batch)
-        tqdm.write(f"{processed}/{total} events embedded")
+    except BaseException:
+        stop.set()
+        _drain(write_queue)
+        raise
+    finally:
+        if cursor is not None:
+            cursor.close()
+        if conn is not None:
+            conn.close()
+    return processed
 
+
+def main():
+    model, device = load_model()
+    encode_batch_size = GPU_ENCODE_BATCH_SIZE if device == "cuda" else ENCODE_BATCH_SIZE
+    print(f"Encoding on {device} (batch size {encode_batch_size})")
+
+    conn = mysql.connect(**DB_CONFIG)
+    ensure_text_hash_column(conn)
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM events")
+    total = cursor.fetchone()[0]
     cursor.close()
     conn.close()
-    print(f"Embeddings backfilled for {processed} events using {MODEL_VERSION}.")
+
+    # fetch -> encode -> write run concurrently; bounded queues cap memory.
+    # Each DB stage owns its connection since cursors are not thread-safe.
+    # A failing stage sets ``stop`` so the others wind down instead of
+    # fetching and encoding the rest of the table.
+    fetch_queue: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    write_queue: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        fetcher = executor.submit(fetch_stage, fetch_queue, stop)
+        encoder = executor.submit(
+            encode_stage, model, device, encode_batch_size, fetch_queue, write_queue, stop
+        )
+        writer = executor.submit(write_stage, write_queue, total, stop)
+        fetcher.result()
+        skipped = encoder.result()
+        processed = writer.result()
+
+    print(f"Embeddings backfilled for {processed} events using {STORED_MODEL_VERSION} "
+          f"({skipped} unchanged events skipped).")
 
 
 if __name__ == "__main__":
@@ -13,19 +13,58 @@ This script:
    - All remaining images copied into a single images folder
 """
 
+import hashlib
 import json
+import os
+import re
 import sys
 import shutil
+import sqlite3
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Set
+from typing import List, Dict, Any, Optional, Tuple, Set
 from datetime import datetime
 from urllib.parse import urlparse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from datasketch import MinHash, MinHashLSH
+    DATASKETCH_AVAILABLE = True
+except ImportError:
+    DATASKETCH_AVAILABLE = False
+
 # Add parent directory to path to import modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.core.run import Run
-from src.core.event import Event
+import numpy as np
+import torch
+
+from src.core.run import EMBEDDING_MODEL, Run, get_sentence_model
+
+# Thread count for reading event JSON files (I/O-bound)
+JSON_READ_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+# Subdirectories of a timestamp folder that hold event JSONs (besides the folder itself).
+# Listed explicitly rather than walked recursively, which would descend into images/.
+EVENT_JSON_SUBDIRS = ("relevant", "non-relevant")
+# Title-blocking prefilter settings (MinHash LSH over title character shingles)
+TITLE_BLOCKING_MIN_EVENTS = 20000  # Only offered for batches at least this large
+TITLE_SHINGLE_SIZE = 5
+MINHASH_NUM_PERM = 64
+MINHASH_LSH_THRESHOLD = 0.5
+# Encode batch size for the one-shot embedding pass over all loaded events
+EMBED_BATCH_SIZE = 256
+# Embeddings from earlier runs, reused for events whose text has not changed
+EMBEDDING_CACHE_PATH = Path(__file__).parent.parent / "data" / "embedding_cache.db"
+EMBEDDING_CACHE_QUERY_CHUNK = 500  # Stays under SQLite's bound-parameter limit
+# Folder-selection input made only of numbers and ranges, e.g. "1,3,5" or "1-5"
+FOLDER_NUMBERS_RE = re.compile(r'[\d,\-\s]+')
+FOLDER_TOKEN_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
 
 
 def find_2026_folders(events_output_dir: Path) -> List[Path]:
@@ -34,9 +73,12 @@ def find_2026_folders(events_output_dir: Path) -> List[Path]:
     if not events_output_dir.exists():
         return folders
     
-    for item in events_output_dir.iterdir():
-        if item.is_dir() and item.name.startswith('2026'):
-            folders.append(item)
+    # DirEntry.is_dir() reuses the type from the directory listing, so
+    # checking the name first avoids a stat per entry
+    with os.scandir(events_output_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith('2026') and entry.is_dir():
+                folders.append(Path(entry.path))
     
     return sorted(folders)
 
@@ -47,9 +89,10 @@ def find_all_folders(events_output_dir: Path) -> List[Path]:
     if not events_output_dir.exists():
         return folders
     
-    for item in events_output_dir.iterdir():
-        if item.is_dir() and not item.name.startswith('.'):  # Skip hidden folders
-            folders.append(item)
+    with os.scandir(events_output_dir) as entries:
+        for entry in entries:
+            if not entry.name.startswith('.') and entry.is_dir():  # Skip hidden folders
+                folders.append(Path(entry.path))
     
     return sorted(folders)
 
@@ -90,34 +133,23 @@ def select_folders_interactive(events_output_dir: Path) -> List[Path]:
                 return all_folders
             
             # Check if it's numbers
-            if choice.replace(',', '').replace('-', '').replace(' ', '').isdigit() or ',' in choice or '-' in choice:
+            if FOLDER_NUMBERS_RE.fullmatch(choice):
                 selected = []
                 # Handle ranges like "1-5" or comma-separated like "1,3,5"
-                parts = choice.replace(' ', '').split(',')
-                for part in parts:
-                    if '-' in part:
+                for match in FOLDER_TOKEN_RE.finditer(choice):
+                    start, end = match.groups()
+                    if end is not None:
                         # Range
-                        start, end = part.split('-', 1)
-                        try:
-                            start_idx = int(start) - 1
-                            end_idx = int(end)
-                            for idx in range(start_idx, end_idx):
-                                if 0 <= idx < len(all_folders):
-                                    selected.append(all_folders[idx])
-                        except ValueError:
-                            print(f"Invalid range: {part}")
-                            continue
-                    else:
-                        # Single number
-                        try:
-                            idx = int(part) - 1
+                        for idx in range(int(start) - 1, int(end)):
                             if 0 <= idx < len(all_folders):
                                 selected.append(all_folders[idx])
-                            else:
-                                print(f"Invalid number: {part}")
-                        except ValueError:
-                            print(f"Invalid number: {part}")
-                            continue
+                    else:
+                        # Single number
+                        idx = int(start) - 1
+                        if 0 <= idx < len(all_folders):
+                            selected.append(all_folders[idx])
+                        else:
+                            print(f"Invalid number: {start}")
                 
                 if selected:
                     return selected
@@ -155,9 +187,35 @@ def select_folders_interactive(events_output_dir: Path) -> List[Path]:
             continue
 
 
+class EventDedupView:
+    """
+    Lightweight stand-in for Event holding only the fields deduplication reads.
+
+    Duck-types the attributes Run._find_batch_duplicates and the image
+    lookup use, so loading skips Event.from_dict's coercion and URL-validation
+    setup for every event.
+    """
+    __slots__ = ('id', 'title', 'blurb', 'description', 'venue_name', 'images', 'raw_dict')
+
+    def __init__(self, event_dict: Dict[str, Any]):
+        # Same defaults as Event.from_dict so embedding texts are unchanged
+        self.title = event_dict.get('title', 'Untitled Event')
+        self.description = event_dict.get('description', '')
+        blurb = event_dict.get('blurb', '')
+        if not blurb and self.description:
+            blurb = self.description[:60].strip() + ('...' if len(self.description) > 60 else '')
+        elif not blurb:
+            blurb = self.title[:60] if self.title else 'No description available'
+        self.blurb = blurb
+        self.id = event_dict.get('id', 431)
+        self.venue_name = event_dict.get('venue_name', '')
+        self.images = event_dict.get('images', [])
+        self.raw_dict = event_dict
+
+
 class EventWithSource:
     """Container for event with its source file information."""
-    def __init__(self, event: Event, source_file: Path, source_folder: Path, event_index: int):
+    def __init__(self, event: EventDedupView, source_file: Path, source_folder: Path, event_index: int):
         self.event = event
         self.source_file = source_file  # JSON file path
         self.source_folder = source_folder  # Folder containing the JSON
@@ -166,107 +224,355 @@ class EventWithSource:
         self.kept_by_event = None  # Reference to the event we're keeping instead
 
 
-def load_all_events_with_sources(folders: List[Path]) -> List[EventWithSource]:
-    """Load all events from all folders with their source file information."""
-    all_events = []
-    
+def read_json_file(json_file: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(json_file.read_bytes())
+    with open(json_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json_file(json_file: Path, data: Any) -> None:
+    """
+    Write JSON with 2-space indent and non-ASCII kept as-is, using orjson when it is installed.
+
+    The data goes to a sibling temp file that then replaces json_file, so an
+    interrupted run never leaves a truncated event file behind.
+    """
+    tmp_file = json_file.with_name(json_file.name + '.tmp')
+    try:
+        if orjson is not None:
+            tmp_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str))
+        else:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        os.replace(tmp_file, json_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def scan_directory(directory: Path) -> Tuple[List[Path], Set[str]]:
+    """List a directory once, returning its JSON files and the names of its subdirectories."""
+    json_files, subdirs = [], set()
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subdirs.add(entry.name)
+            elif os.path.normcase(entry.name).endswith('.json') and entry.is_file():
+                json_files.append(Path(entry.path))
+    return json_files, subdirs
+
+
+@dataclass
+class FolderIndex:
+    """
+    Directory listing of one selected folder, shared by the load, removal and merge stages.
+
+    The event JSONs are listed up front; images/ is walked only when a stage
+    first asks for it, so folders without duplicates are walked once, at merge.
+    """
+    folder: Path
+    json_files: List[Path]
+    image_index: Optional[Dict[str, Dict[str, List[Path]]]] = None
+
+    def images(self) -> Dict[str, Dict[str, List[Path]]]:
+        """Return the folder's image index (see build_image_index), building it on first use."""
+        if self.image_index is None:
+            self.image_index = build_image_index(self.folder / "images")
+        return self.image_index
+
+    def discard_image(self, img_file: Path) -> None:
+        """Drop a deleted image so later stages do not try to use it."""
+        index = self.images()
+        base_name = img_file.name.rsplit('.', 1)[0]
+        for bucket, key in ((index['by_name'], img_file.name), (index['by_base'], base_name)):
+            paths = bucket.get(key)
+            if paths and img_file in paths:
+                paths.remove(img_file)
+
+
+def index_folders(folders: List[Path]) -> Dict[Path, FolderIndex]:
+    """List the JSONs in each folder and its relevant/non-relevant subdirectories, keyed by folder."""
+    folder_indexes: Dict[Path, FolderIndex] = {}
+    # A folder picked twice would load every event twice and flag each as its own duplicate
+    seen_folders: Set[Path] = set()
     for folder in folders:
-        # Look for JSON files directly in folder
-        for json_file in folder.glob("*.json"):
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    events_list = data if isinstance(data, list) else [data]
-                    
-                    for idx, event_dict in enumerate(events_list):
-                        try:
-                            # Set skip_url_validation to avoid API calls during loading
-                            event_dict['skip_url_validation'] = True
-                            event = Event.from_dict(event_dict)
-                            all_events.append(EventWithSource(event, json_file, folder, idx))
-                        except Exception as e:
-                            continue
-            except Exception as e:
-                continue
-        
-        # Look in relevant/ subdirectory
-        relevant_dir = folder / "relevant"
-        if relevant_dir.exists():
-            for json_file in relevant_dir.glob("*.json"):
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        events_list = data if isinstance(data, list) else [data]
-                        
-                        for idx, event_dict in enumerate(events_list):
-                            try:
-                                # Set skip_url_validation to avoid API calls during loading
-                                event_dict['skip_url_validation'] = True
-                                event = Event.from_dict(event_dict)
-                                all_events.append(EventWithSource(event, json_file, folder, idx))
-                            except Exception as e:
-                                continue
-                except Exception as e:
-                    continue
-        
-        # Look in non-relevant/ subdirectory
-        nonrelevant_dir = folder / "non-relevant"
-        if nonrelevant_dir.exists():
-            for json_file in nonrelevant_dir.glob("*.json"):
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        events_list = data if isinstance(data, list) else [data]
-                        
-                        for idx, event_dict in enumerate(events_list):
-                            try:
-                                # Set skip_url_validation to avoid API calls during loading
-                                event_dict['skip_url_validation'] = True
-                                event = Event.from_dict(event_dict)
-                                all_events.append(EventWithSource(event, json_file, folder, idx))
-                            except Exception as e:
-                                continue
-                except Exception as e:
-                    continue
-    
-    return all_events
+        resolved = folder.resolve()
+        if resolved in seen_folders:
+            continue
+        seen_folders.add(resolved)
+        try:
+            json_files, subdirs = scan_directory(folder)
+        except OSError:
+            continue
+        # The root listing already tells us which subdirectories exist
+        for subdir in EVENT_JSON_SUBDIRS:
+            if subdir in subdirs:
+                json_files.extend(scan_directory(folder / subdir)[0])
+        folder_indexes[folder] = FolderIndex(folder, json_files)
+    return folder_indexes
+
+
+def read_event_list(json_file: Path) -> List[Dict[str, Any]]:
+    """
+    Read the events in a JSON file as a list.
+
+    A file holding a single event object becomes a one-item list. Every stage
+    works on this list form, and rewrites always save a list.
+    """
+    data = read_json_file(json_file)
+    return data if isinstance(data, list) else [data]
 
 
-def find_duplicates_semantic(events_with_sources: List[EventWithSource], run: Run, sim_threshold: float = 0.85) -> List[EventWithSource]:
+def load_events_from_file(json_file: Path, folder: Path) -> Tuple[List[EventWithSource], List[Dict[str, Any]]]:
+    """
+    Load every event in a single JSON file, skipping invalid events.
+
+    Returns the events and the file's raw event dicts (see read_event_list),
+    or ([], None) if the file cannot be read.
+    """
+    try:
+        events_list = read_event_list(json_file)
+    except Exception:
+        return [], None
+
+    events = []
+    for idx, event_dict in enumerate(events_list):
+        try:
+            events.append(EventWithSource(EventDedupView(event_dict), json_file, folder, idx))
+        except Exception:
+            continue
+    return events, events_list
+
+
+def load_all_events_with_sources(
+    folder_indexes: Dict[Path, FolderIndex],
+) -> Tuple[List[EventWithSource], Dict[Path, List[Dict[str, Any]]]]:
+    """
+    Load all events from the indexed folders with their source file information.
+
+    Also returns the raw event dicts of every readable file, keyed by path, so
+    the removal and merge phases can reuse them instead of re-reading from disk.
+    """
+    json_files = [
+        (json_file, index.folder)
+        for index in folder_indexes.values()
+        for json_file in index.json_files
+    ]
+    all_events = []
+    raw_events_by_file: Dict[Path, List[Dict[str, Any]]] = {}
+
+    # Reading many small JSON files is I/O-bound, so threads overlap the waits;
+    # executor.map keeps results in file order so dedup stays deterministic.
+    # Threads rather than processes: parsing is cheap (orjson, lightweight
+    # views), while worker processes would re-import this script (torch,
+    # src.core.run) on spawn and pickle every parsed event back.
+    with ThreadPoolExecutor(max_workers=JSON_READ_WORKERS) as executor:
+        results = executor.map(lambda args: load_events_from_file(*args), json_files)
+        for (json_file, _), (events, events_list) in zip(json_files, results):
+            all_events.extend(events)
+            if events_list is not None:
+                raw_events_by_file[json_file] = events_list
+
+    return all_events, raw_events_by_file
+
+
+def title_candidate_pairs(events: List[EventDedupView]) -> Set[Tuple[int, int]]:
+    """
+    Block events into candidate pairs with MinHash LSH on title character shingles.
+
+    Only pairs whose titles land in a shared LSH bucket are returned, so
+    semantic duplicates with clearly different titles will not be compared.
+    """
+    lsh = MinHashLSH(threshold=MINHASH_LSH_THRESHOLD, num_perm=MINHASH_NUM_PERM)
+    minhashes = []
+    for idx, event in enumerate(events):
+        title = (event.title or '').lower()
+        mh = MinHash(num_perm=MINHASH_NUM_PERM)
+        for k in range(max(1, len(title) - TITLE_SHINGLE_SIZE + 1)):
+            mh.update(title[k:k + TITLE_SHINGLE_SIZE].encode('utf-8'))
+        lsh.insert(idx, mh)
+        minhashes.append(mh)
+
+    pairs: Set[Tuple[int, int]] = set()
+    for idx, mh in enumerate(minhashes):
+        for other in lsh.query(mh):
+            if other != idx:
+                pairs.add((min(idx, other), max(idx, other)))
+    return pairs
+
+
+class EmbeddingCache:
+    """
+    SQLite store of normalized event embeddings from earlier dedup runs.
+
+    Rows are keyed by a hash of the embedded text plus the model name, so an
+    edited event or a model change is simply a miss. Vectors are kept as
+    float16, like event_embeddings in the database.
+    """
+
+    def __init__(self, path: Path, model_name: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.model_name = model_name
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                text_hash BLOB NOT NULL,
+                model TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                PRIMARY KEY (text_hash, model)
+            )
+        """)
+
+    @staticmethod
+    def key(text: str) -> bytes:
+        """16-byte content hash of an event's embedding text."""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, np.ndarray]:
+        """Return the cached float32 vectors for whichever keys are present."""
+        found: Dict[bytes, np.ndarray] = {}
+        unique_keys = list(set(keys))
+        for start in range(0, len(unique_keys), EMBEDDING_CACHE_QUERY_CHUNK):
+            chunk = unique_keys[start:start + EMBEDDING_CACHE_QUERY_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT text_hash, embedding FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})",
+                (self.model_name, *chunk),
+            )
+            for key, blob in rows:
+                found[bytes(key)] = np.frombuffer(blob, dtype=np.float16).astype(np.float32)
+        return found
+
+    def put_many(self, keys: List[bytes], vectors: np.ndarray) -> None:
+        """Store vectors under their keys, replacing any existing rows."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (text_hash, model, embedding) VALUES (?, ?, ?)",
+                [(key, self.model_name, vector.astype(np.float16).tobytes()) for key, vector in zip(keys, vectors)],
+            )
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def find_duplicates_semantic(events_with_sources: List[EventWithSource], run: Run, sim_threshold: float = 0.85,
+                             title_blocking: bool = False) -> List[EventWithSource]:
     """
     Find duplicates within the batch using semantic similarity.
     Compares all events against each other and keeps the first occurrence of each duplicate group.
+    
+    With title_blocking, only events whose titles are similar under MinHash LSH
+    are compared. Faster on very large batches, but may miss duplicates with
+    differently worded titles.
     """
     if not events_with_sources or len(events_with_sources) <= 1:
         return []
     
     events = [ews.event for ews in events_with_sources]
     
-    # Use Run's within-batch deduplication to find which events to keep
-    # This compares events within the batch, not against database
-    kept_events = run._deduplicate_within_batch(events, sim_threshold=sim_threshold)
-    kept_set = {id(evt) for evt in kept_events}
+    # Same text format as the database embeddings
+    texts = [
+        " ".join(filter(None, (e.title or '', e.blurb or '', e.description or ''))).strip() or " "
+        for e in events
+    ]
+    keys = [EmbeddingCache.key(text) for text in texts]
+    
+    # Reuse embeddings from earlier runs; only new or edited events are encoded
+    cache = EmbeddingCache(EMBEDDING_CACHE_PATH, EMBEDDING_MODEL)
+    try:
+        vectors_by_key = cache.get_many(keys)
+        text_by_key = dict(zip(keys, texts))
+        missing_keys = [key for key in text_by_key if key not in vectors_by_key]
+        print(f"   Embedding cache: {len(text_by_key) - len(missing_keys)} reused, {len(missing_keys)} to encode")
+        if missing_keys:
+            # Encode in one call so SentenceTransformer can length-sort
+            # the whole set into batches
+            model = get_sentence_model()
+            new_vectors = model.encode(
+                [text_by_key[key] for key in missing_keys],
+                batch_size=EMBED_BATCH_SIZE,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=True,
+                device="cuda" if torch.cuda.is_available() else "cpu",
+            )
+            # Compare exactly what the cache hands back on later runs, so pairs
+            # near the threshold dedup the same on a cold run and on reruns
+            new_vectors = new_vectors.astype(np.float16)
+            cache.put_many(missing_keys, new_vectors)
+            vectors_by_key.update(zip(missing_keys, new_vectors.astype(np.float32)))
+    finally:
+        cache.close()
+    embeddings = np.stack([vectors_by_key[key] for key in keys])
+    
+    # Use Run's within-batch duplicate search (FAISS range search over the
+    # normalized embeddings when faiss is installed). This compares events
+    # within the batch, not against database
+    candidate_pairs = None
+    if title_blocking:
+        if DATASKETCH_AVAILABLE:
+            candidate_pairs = title_candidate_pairs(events)
+            print(f"   Title blocking: {len(candidate_pairs)} candidate pairs")
+        else:
+            print("   ⚠️ datasketch not installed (pip install datasketch) — comparing all pairs")
+    
+    duplicate_of = run._find_batch_duplicates(events, sim_threshold=sim_threshold, embeddings=embeddings,
+                                              candidate_pairs=candidate_pairs)
     
-    # Mark events as duplicates if they weren't kept
+    # Mark duplicates and record which event each one was matched to
     duplicates = []
-    for ews in events_with_sources:
-        if id(ews.event) not in kept_set:
+    for idx, ews in enumerate(events_with_sources):
+        if idx in duplicate_of:
             ews.is_duplicate = True
+            ews.kept_by_event = events_with_sources[duplicate_of[idx]]
             duplicates.append(ews)
     
     return duplicates
 
 
-def get_image_paths_from_event(event: Event, source_folder: Path) -> List[Path]:
-    """Get all image file paths associated with an event."""
+IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.webp']
+
+
+def build_image_index(images_dir: Path) -> Dict[str, Dict[str, List[Path]]]:
+    """
+    Walk an images directory once and index its files for lookup.
+
+    Returns a dict with 'by_name' (full filename -> paths) and 'by_base'
+    (filename without extension -> paths, for IMAGE_EXTENSIONS only).
+    """
+    index: Dict[str, Dict[str, List[Path]]] = {'by_name': {}, 'by_base': {}}
+
+    # os.walk separates files from directories using the listing itself,
+    # so one pass covers the tree without a stat per entry. A missing
+    # images/ just yields nothing, so no separate exists() check is needed.
+    for dirpath, _, filenames in os.walk(images_dir):
+        for name in filenames:
+            img_file = Path(dirpath) / name
+            index['by_name'].setdefault(name, []).append(img_file)
+            if '.' in name:
+                base_name, ext = name.rsplit('.', 1)
+                if f".{ext}" in IMAGE_EXTENSIONS:
+                    index['by_base'].setdefault(base_name, []).append(img_file)
+
+    return index
+
+
+def get_image_paths_from_event(event: EventDedupView, source_folder: Path, image_index: Dict[str, Dict[str, List[Path]]] = None) -> List[Path]:
+    """Get all image file paths associated with an event.
+
+    Pass a prebuilt ``image_index`` (see build_image_index) when looking up
+    many events from the same folder to avoid re-walking the images tree.
+    """
     image_paths = []
+    seen: Set[Path] = set()
     
     if not event.images:
         return image_paths
     
-    images_dir = source_folder / "images"
-    if not images_dir.exists():
-        return image_paths
+    if image_index is None:
+        image_index = build_image_index(source_folder / "images")
     
     for img_dict in event.images:
         img_url = img_dict.get('url', '')
@@ -277,23 +583,31 @@ def get_image_paths_from_event(event: Event, source_folder: Path) -> List[Path]:
         parsed_url = urlparse(img_url)
         filename = Path(parsed_url.path).name
         
-        # Try to find the image file in images directory
-        # Could be in subdirectories too
-        for img_file in images_dir.rglob(filename):
-            image_paths.append(img_file)
-        
-        # Also check for filename with different extensions or variations
+        # Exact filename match anywhere under images/ (could be in subdirectories),
+        # then the same name with different extensions or variations
         base_name = filename.rsplit('.', 1)[0] if '.' in filename else filename
-        for ext in ['.jpg', '.jpeg', '.png', '.webp']:
-            for img_file in images_dir.rglob(f"{base_name}{ext}"):
-                if img_file not in image_paths:
-                    image_paths.append(img_file)
+        for img_file in image_index['by_name'].get(filename, []) + image_index['by_base'].get(base_name, []):
+            if img_file not in seen:
+                seen.add(img_file)
+                image_paths.append(img_file)
     
     return image_paths
 
 
-def remove_duplicates_from_files(events_with_sources: List[EventWithSource], duplicates: List[EventWithSource]) -> Dict[str, Any]:
-    """Remove duplicate events from their source JSON files and delete associated images."""
+def remove_duplicates_from_files(
+    events_with_sources: List[EventWithSource],
+    duplicates: List[EventWithSource],
+    raw_events_by_file: Dict[Path, List[Dict[str, Any]]],
+    folder_indexes: Dict[Path, FolderIndex],
+) -> Dict[str, Any]:
+    """
+    Remove duplicate events from their source JSON files and delete associated images.
+
+    Works on the events cached by load_all_events_with_sources and updates that
+    cache, so a later merge sees the deduplicated events. Deleted images are
+    dropped from folder_indexes for the same reason. Modified files are written
+    back together at the end.
+    """
     stats = {
         'files_modified': 0,
         'events_removed': 0,
@@ -302,56 +616,79 @@ def remove_duplicates_from_files(events_with_sources: List[EventWithSource], dup
     }
     
     # Group duplicates by source file
-    duplicates_by_file: Dict[Path, List[EventWithSource]] = {}
+    duplicates_by_file: Dict[Path, List[EventWithSource]] = defaultdict(list)
     for dup in duplicates:
-        if dup.source_file not in duplicates_by_file:
-            duplicates_by_file[dup.source_file] = []
         duplicates_by_file[dup.source_file].append(dup)
     
+    # Duplicates can share image files, so collect them first and delete each once
+    images_to_delete: Dict[Path, FolderIndex] = {}
+    
+    # (json_file, remaining events, removed count) for each file to rewrite
+    pending_writes: List[Tuple[Path, List[Dict[str, Any]], int]] = []
+    
     # Process each file
     for json_file, file_duplicates in duplicates_by_file.items():
         try:
-            # Load the file
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            events_list = data if isinstance(data, list) else [data]
-            
-            # Get indices to remove (in reverse order to maintain indices)
-            indices_to_remove = sorted([dup.event_index for dup in file_duplicates], reverse=True)
+            events_list = raw_events_by_file[json_file]
+            indices_to_remove = {dup.event_index for dup in file_duplicates}
             
-            # Delete images for duplicates
+            # Collect images for duplicates
             for dup in file_duplicates:
-                image_paths = get_image_paths_from_event(dup.event, dup.source_folder)
-                for img_path in image_paths:
-                    try:
-                        if img_path.exists():
-                            img_path.unlink()
-                            stats['images_deleted'] += 1
-                    except Exception as e:
-                        stats['errors'].append(f"Failed to delete {img_path}: {e}")
+                folder_index = folder_indexes[dup.source_folder]
+                for img_path in get_image_paths_from_event(dup.event, dup.source_folder, folder_index.images()):
+                    images_to_delete[img_path] = folder_index
             
-            # Remove events from list
-            removed_count = 0
-            for idx in indices_to_remove:
-                if 0 <= idx < len(events_list):
-                    events_list.pop(idx)
-                    removed_count += 1
+            # Rebuild the list in one pass rather than popping index by index
+            kept_events = [e for i, e in enumerate(events_list) if i not in indices_to_remove]
+            removed_count = len(events_list) - len(kept_events)
             
             if removed_count > 0:
-                # Save the modified file
-                output_data = events_list if isinstance(data, list) else (events_list[0] if events_list else {})
-                with open(json_file, 'w', encoding='utf-8') as f:
-                    json.dump(output_data, f, indent=2, ensure_ascii=False, default=str)
-                
-                stats['files_modified'] += 1
-                stats['events_removed'] += removed_count
-                print(f"   ✅ Removed {removed_count} duplicate(s) from {json_file.name}")
+                # Always written as a list: a single-object file only holds one
+                # event, so removing it leaves [] rather than a stray {} event
+                pending_writes.append((json_file, kept_events, removed_count))
         
         except Exception as e:
             stats['errors'].append(f"Failed to process {json_file}: {e}")
             print(f"   ❌ Error processing {json_file.name}: {e}")
     
+    def _unlink(img_path: Path) -> Optional[Exception]:
+        # unlink reports a missing file itself, so no exists() check
+        try:
+            img_path.unlink()
+        except Exception as e:
+            return e
+        return None
+    
+    # Delete images for duplicates in parallel, like the file rewrites below
+    image_list = list(images_to_delete)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for img_path, error in zip(image_list, executor.map(_unlink, image_list)):
+            if error is None:
+                stats['images_deleted'] += 1
+            elif not isinstance(error, FileNotFoundError):
+                stats['errors'].append(f"Failed to delete {img_path}: {error}")
+                continue
+            images_to_delete[img_path].discard_image(img_path)
+    
+    def _write(item: Tuple[Path, List[Dict[str, Any]], int]) -> Optional[Exception]:
+        try:
+            write_json_file(item[0], item[1])
+        except Exception as e:
+            return e
+        return None
+    
+    # Rewrite the modified files in parallel instead of one blocking write at a time
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for (json_file, kept_events, removed_count), error in zip(pending_writes, executor.map(_write, pending_writes)):
+            if error is not None:
+                stats['errors'].append(f"Failed to process {json_file}: {error}")
+                print(f"   ❌ Error processing {json_file.name}: {error}")
+                continue
+            raw_events_by_file[json_file] = kept_events
+            stats['files_modified'] += 1
+            stats['events_removed'] += removed_count
+            print(f"   ✅ Removed {removed_count} duplicate(s) from {json_file.name}")
+    
     return stats
 
 
@@ -372,11 +709,18 @@ def categorize_event_source(source_file: Path) -> str:
 def merge_events_into_new_folder(
     folders: List[Path],
     base_dir: Path,
+    raw_events_by_file: Dict[Path, List[Dict[str, Any]]] = None,
+    folder_indexes: Dict[Path, FolderIndex] = None,
 ) -> Dict[str, Any]:
     """
     After deduplication, merge all remaining events and images into
     a new timestamped folder under data/dedup/.
     
+    If raw_events_by_file (from load_all_events_with_sources) is given, the
+    events are taken from it; otherwise the JSON files are read from disk.
+    folder_indexes (from index_folders) is reused when given, so folders
+    already listed or walked are not scanned again.
+    
     Structure:
       data/dedup/<timestamp>/
         ├── relevant/merged_relevant.json
@@ -393,6 +737,9 @@ def merge_events_into_new_folder(
     if not folders:
         return stats
 
+    if folder_indexes is None:
+        folder_indexes = index_folders(folders)
+
     # Use data/dedup as the base directory for merged folders
     dedup_dir = base_dir / "data" / "dedup"
     dedup_dir.mkdir(parents=True, exist_ok=True)
@@ -413,44 +760,32 @@ def merge_events_into_new_folder(
     nonrelevant_dir.mkdir(parents=True, exist_ok=True)
     images_dir.mkdir(parents=True, exist_ok=True)
 
-    # Merge events by reading JSON files directly (no Event reconstruction)
+    # Merge raw event dicts directly (no Event reconstruction)
     print("\n📄 Scanning JSON files for merging...")
     relevant_events: List[Dict[str, Any]] = []
     nonrelevant_events: List[Dict[str, Any]] = []
 
-    def _gather_from_json_dir(root_folder: Path, json_dir: Path) -> None:
-        """Load events from all JSON files in a directory into the appropriate bucket."""
-        for json_file in json_dir.glob("*.json"):
-            try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except Exception:
-                continue
-
-            events_list = data if isinstance(data, list) else [data]
-
-            for event_dict in events_list:
-                try:
-                    category = categorize_event_source(json_file)
-                    if category == "relevant":
-                        relevant_events.append(event_dict)
-                    else:
-                        nonrelevant_events.append(event_dict)
-                except Exception:
-                    continue
-
-    for folder in folders:
-        # JSONs directly under the timestamp folder
-        _gather_from_json_dir(folder, folder)
-
-        # JSONs under relevant/ and non-relevant/
-        rel_dir = folder / "relevant"
-        if rel_dir.exists():
-            _gather_from_json_dir(folder, rel_dir)
+    def _read_events(json_file: Path) -> List[Dict[str, Any]]:
+        """Read the events in one JSON file, or none if it cannot be parsed."""
+        try:
+            return read_event_list(json_file)
+        except Exception:
+            return []
 
-        nonrel_dir = folder / "non-relevant"
-        if nonrel_dir.exists():
-            _gather_from_json_dir(folder, nonrel_dir)
+    if raw_events_by_file is not None:
+        events_by_file = list(raw_events_by_file.items())
+    else:
+        # Read every JSON (root, relevant/, non-relevant/) concurrently rather than
+        # one open+read at a time; map() keeps the original file order.
+        json_files = [json_file for index in folder_indexes.values() for json_file in index.json_files]
+        with ThreadPoolExecutor(max_workers=JSON_READ_WORKERS) as executor:
+            events_by_file = list(zip(json_files, executor.map(_read_events, json_files)))
+
+    for json_file, events_list in events_by_file:
+        if categorize_event_source(json_file) == "relevant":
+            relevant_events.extend(events_list)
+        else:
+            nonrelevant_events.extend(events_list)
 
     print(f"   ➤ Total relevant events found: {len(relevant_events)}")
     print(f"   ➤ Total non-relevant events found: {len(nonrelevant_events)}")
@@ -459,11 +794,10 @@ def merge_events_into_new_folder(
     relevant_path = relevant_dir / "merged_relevant.json"
     nonrelevant_path = nonrelevant_dir / "merged_non_relevant.json"
 
-    with open(relevant_path, "w", encoding="utf-8") as f:
-        json.dump(relevant_events, f, indent=2, ensure_ascii=False, default=str)
-
-    with open(nonrelevant_path, "w", encoding="utf-8") as f:
-        json.dump(nonrelevant_events, f, indent=2, ensure_ascii=False, default=str)
+    # Events are plain dicts parsed from JSON, so the default=str fallback is
+    # never hit and orjson can serialize each list in a single write
+    write_json_file(relevant_path, relevant_events)
+    write_json_file(nonrelevant_path, nonrelevant_events)
 
     stats["merged_timestamp"] = merged_dir.name
     stats["relevant_events"] = len(relevant_events)
@@ -472,21 +806,25 @@ def merge_events_into_new_folder(
     # Collect and copy images from all selected folders into the merged images dir
     print("\n🖼️  Collecting images into merged images folder...")
     images_copied = 0
-    for folder in folders:
-        src_images_dir = folder / "images"
-        if not src_images_dir.exists():
-            continue
-        for img_path in src_images_dir.rglob("*"):
-            if not img_path.is_file():
-                continue
+    created_dirs: Set[Path] = {images_dir}
+    for index in folder_indexes.values():
+        src_images_dir = index.folder / "images"
+        # The index lists files only, so no per-path is_file() check is needed
+        img_paths = [img_path for paths in index.images()['by_name'].values() for img_path in paths]
+        for img_path in img_paths:
             try:
                 rel_path = img_path.relative_to(src_images_dir)
                 target_path = images_dir / rel_path
-                target_path.parent.mkdir(parents=True, exist_ok=True)
+                if target_path.parent not in created_dirs:
+                    target_path.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(target_path.parent)
                 # If an image with same relative path already exists, keep the first one
                 if target_path.exists():
                     continue
-                shutil.copy2(img_path, target_path)
+                # copyfile skips copy2's metadata pass and uses sendfile on Linux.
+                # Not hardlinked: the review UI rewrites images in place, which
+                # would silently change the originals too.
+                shutil.copyfile(img_path, target_path)
                 images_copied += 1
             except Exception:
                 continue
@@ -525,17 +863,17 @@ def main():
     for folder in folders:
         print(f"   - {folder.name}")
     
+    # List each folder once; every later stage reads from these indexes
+    folder_indexes = index_folders(folders)
+    
     # Load all events with source information
     print("\n📄 Loading events from all folders...")
-    all_events_with_sources = load_all_events_with_sources(folders)
+    all_events_with_sources, raw_events_by_file = load_all_events_with_sources(folder_indexes)
     
     print(f"✅ Loaded {len(all_events_with_sources)} total events")
     
     # Count per folder
-    folder_counts = {}
-    for ews in all_events_with_sources:
-        folder_name = ews.source_folder.name
-        folder_counts[folder_name] = folder_counts.get(folder_name, 0) + 1
+    folder_counts = Counter(ews.source_folder.name for ews in all_events_with_sources)
     
     print("\n📊 Events per folder:")
     for folder_name, count in sorted(folder_counts.items()):
@@ -546,19 +884,22 @@ def main():
     run = Run(timestamp=datetime.now().strftime("%Y%m%d_%H%M%S"), blog_name=None)
     run.setup_directories()
     
-    duplicates = find_duplicates_semantic(all_events_with_sources, run, sim_threshold=0.85)
+    title_blocking = False
+    if len(all_events_with_sources) >= TITLE_BLOCKING_MIN_EVENTS:
+        blocking_choice = input(f"Large batch ({len(all_events_with_sources)} events). Only compare events with similar titles? "
+                                "Faster, but may miss reworded duplicates (yes/no): ").strip().lower()
+        title_blocking = blocking_choice in ['yes', 'y']
+    
+    duplicates = find_duplicates_semantic(all_events_with_sources, run, sim_threshold=0.85, title_blocking=title_blocking)
     
     print(f"\n✅ Found {len(duplicates)} duplicate events to remove")
     
     if duplicates:
         # Show what will be removed
         print("\n📋 Duplicates to be removed:")
-        duplicates_by_folder = {}
+        duplicates_by_folder: Dict[str, List[EventWithSource]] = defaultdict(list)
         for dup in duplicates:
-            folder_name = dup.source_folder.name
-            if folder_name not in duplicates_by_folder:
-                duplicates_by_folder[folder_name] = []
-            duplicates_by_folder[folder_name].append(dup)
+            duplicates_by_folder[dup.source_folder.name].append(dup)
         
         for folder_name, folder_dups in sorted(duplicates_by_folder.items()):
             print(f"\n   {folder_name}: {len(folder_dups)} duplicate(s)")
@@ -576,7 +917,7 @@ def main():
         else:
             # Remove duplicates from files and delete images
             print("\n🗑️  Removing duplicates from files...")
-            stats = remove_duplicates_from_files(all_events_with_sources, duplicates)
+            stats = remove_duplicates_from_files(all_events_with_sources, duplicates, raw_events_by_file, folder_indexes)
             
             # Print dedup summary
             print("\n" + "="*60)
@@ -595,7 +936,7 @@ def main():
     
     # Merge remaining events and images into new timestamp folder
     print("\n📦 Merging remaining events into new timestamp folder...")
-    merge_stats = merge_events_into_new_folder(folders, base_dir)
+    merge_stats = merge_events_into_new_folder(folders, base_dir, raw_events_by_file, folder_indexes)
     
     print("\n" + "="*60)
     print("✅ MERGE COMPLETE")
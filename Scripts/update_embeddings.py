@@ -1,9 +1,18 @@
+import sys
+from pathlib import Path
+
 import numpy as np
 import mysql.connector as mysql
+import torch
 from dotenv import load_dotenv
 import os
 from sentence_transformers import SentenceTransformer
 
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.run import EMBEDDING_MODEL, EMBEDDING_MODEL_FP16
+
 load_dotenv()
 DB_CONFIG = {
     "host": "192.168.50.166",
@@ -14,45 +23,72 @@ DB_CONFIG = {
     "charset": "utf8mb4",
 }
 
-EMBEDDING_MODEL = "all-mpnet-base-v2"
-_embedding_model = SentenceTransformer(EMBEDDING_MODEL)
+# Rows streamed from MySQL per encode/upsert round
+FETCH_BATCH_SIZE = 2048
+ENCODE_BATCH_SIZE = 64
+GPU_ENCODE_BATCH_SIZE = 256
+UPSERT_CHUNK_SIZE = 500
+
+_device = "cuda" if torch.cuda.is_available() else "cpu"
+_embedding_model = SentenceTransformer(EMBEDDING_MODEL, device=_device)
+if _device == "cuda":
+    _embedding_model.half()
+_encode_batch_size = GPU_ENCODE_BATCH_SIZE if _device == "cuda" else ENCODE_BATCH_SIZE
+
+UPSERT_SQL = """
+    INSERT INTO event_embeddings (id, embedding, embedding_model)
+    VALUES (%s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        embedding = VALUES(embedding),
+        embedding_model = VALUES(embedding_model)
+"""
+
+
+def upsert_event_embeddings(cursor, rows) -> None:
+    """Embed a batch of (id, title, blurb, description) rows in one encode call and store them."""
+    event_ids = [row[0] for row in rows]
+    texts = [
+        " ".join(filter(None, (title, blurb, description))).strip() or " "
+        for _, title, blurb, description in rows
+    ]
+    vectors = _embedding_model.encode(
+        texts, batch_size=_encode_batch_size, convert_to_numpy=True, show_progress_bar=False
+    ).astype(np.float16)
+    params = [(event_id, vector.tobytes(), EMBEDDING_MODEL_FP16) for event_id, vector in zip(event_ids, vectors)]
+    for start in range(0, len(params), UPSERT_CHUNK_SIZE):
+        cursor.executemany(UPSERT_SQL, params[start:start + UPSERT_CHUNK_SIZE])
 
 
-def upsert_event_embedding(cursor, event_id: int, title: str, blurb: str, description: str) -> None:
-    """Embed a single event once and store it."""
-    text = " ".join(filter(None, (title, blurb, description))).strip() or " "
-    vector = _embedding_model.encode([text], convert_to_numpy=True).astype(np.float32)[0]
-    cursor.execute(
-        """
-        INSERT INTO event_embeddings (id, embedding, embedding_model)
-        VALUES (%s, %s, %s)
-        ON DUPLICATE KEY UPDATE
-            embedding = VALUES(embedding),
-            embedding_model = VALUES(embedding_model)
-        """,
-        (event_id, vector.tobytes(), EMBEDDING_MODEL),
-    )
+MISSING_EVENTS_SQL = """
+    SELECT e.id, e.title, e.blurb, e.description
+    FROM events e
+    LEFT JOIN event_embeddings emb ON emb.id = e.id
+    WHERE emb.id IS NULL
+"""
 
 
 def main():
-    conn = mysql.connect(**DB_CONFIG)
-    cursor = conn.cursor()
-    cursor.execute(
-        """
-        SELECT e.id, e.title, e.blurb, e.description
-        FROM events e
-        LEFT JOIN event_embeddings emb ON emb.id = e.id
-        WHERE emb.id IS NULL
-        """
-    )
-    rows = cursor.fetchall()
-    print(f"Found {len(rows)} events missing embeddings")
-    for event_id, title, blurb, description in rows:
-        upsert_event_embedding(cursor, event_id, title, blurb, description)
-    conn.commit()
-    cursor.close()
-    conn.close()
-    print("Embeddings updated successfully")
+    # Rows are streamed on an unbuffered cursor, which keeps its connection
+    # busy until fully read, so upserts go through a second connection
+    read_conn = mysql.connect(**DB_CONFIG)
+    write_conn = mysql.connect(**DB_CONFIG)
+    read_cursor = read_conn.cursor(buffered=False)
+    write_cursor = write_conn.cursor()
+    read_cursor.execute(MISSING_EVENTS_SQL)
+    processed = 0
+    while True:
+        rows = read_cursor.fetchmany(FETCH_BATCH_SIZE)
+        if not rows:
+            break
+        upsert_event_embeddings(write_cursor, rows)
+        processed += len(rows)
+        print(f"{processed} events embedded")
+    write_conn.commit()
+    read_cursor.close()
+    write_cursor.close()
+    read_conn.close()
+    write_conn.close()
+    print(f"Embeddings updated successfully for {processed} events missing embeddings")
 
 
 if __name__ == "__main__":
@@ -1,9 +1,15 @@
 #!/usr/bin/env python3
 """
 Reusable script to add local_path and filename to existing image objects in JSON files.
-Usage: python add_image_paths.py [json_folder] [images_folder]
+Usage: python add_image_paths.py [json_folder] [images_folder] [--verbose]
+
+Pass --verbose to print every image match; otherwise one summary per JSON file.
 
 Example: python add_image_paths.py data/events_output/20251015_000000 data/events_output/20251015_000000/images
+
+Only the standard library (plus optional orjson) is used, so the script also
+runs unchanged under PyPy, which is noticeably faster on large image folders:
+    pypy3 add_image_paths.py <json_folder> <images_folder>
 """
 
 import json
@@ -12,13 +18,49 @@ import sys
 from pathlib import Path
 from collections import defaultdict
 
-def add_local_paths_to_json(json_folder_path, images_folder_path):
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.gif', '.svg'}
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def read_json_file(json_file):
+    """Load an event JSON file (orjson if available)."""
+    if orjson is not None:
+        return orjson.loads(json_file.read_bytes())
+    with open(json_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json_file(json_file, data):
+    """
+    Save events back in place without risking a half-written file.
+    
+    The JSON goes to a .tmp sibling first and is swapped in with os.replace,
+    so stopping the script mid-write leaves the original file intact.
+    """
+    tmp_file = json_file.with_name(json_file.name + '.tmp')
+    try:
+        if orjson is not None:
+            tmp_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, json_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+def add_local_paths_to_json(json_folder_path, images_folder_path, verbose=False):
     """
     Add local_path and filename to existing image objects while preserving all other data.
     
     Args:
         json_folder_path (str): Path to folder containing JSON files
         images_folder_path (str): Path to folder containing images
+        verbose (bool): Print a line per event/image instead of a summary per file
     """
     json_path = Path(json_folder_path)
     images_path = Path(images_folder_path)
@@ -34,25 +76,35 @@ def add_local_paths_to_json(json_folder_path, images_folder_path):
         print(f"Error: Images folder not found: {images_path}")
         return False
     
-    # Create a map of all available image filenames in the images folder
+    # Create a map of all available image filenames in the images folder.
+    # The extension is checked first, and DirEntry.is_file() reuses the type
+    # from the directory listing, so entries are not stat'ed one by one.
     available_images = {}
-    for image_file in images_path.glob("*"):
-        if image_file.is_file() and image_file.suffix.lower() in ['.jpg', '.jpeg', '.png', '.webp', '.gif', '.svg']:
-            filename = image_file.name
-            available_images[filename] = image_file
+    with os.scandir(images_path) as entries:
+        for entry in entries:
+            filename = entry.name
+            if os.path.splitext(filename)[1].lower() in IMAGE_EXTENSIONS and entry.is_file():
+                available_images[filename] = Path(entry.path)
     
     print(f"Found {len(available_images)} image files in {images_path}")
     
+    # Lowercased name -> (actual name, path) for case-insensitive lookups;
+    # the first file wins when names differ only by case
+    available_images_ci = {}
+    for filename, image_file in available_images.items():
+        available_images_ci.setdefault(filename.lower(), (filename, image_file))
+    
     # Process each JSON file
     total_updated = 0
     for json_file in json_path.glob("*.json"):
         print(f"\nProcessing {json_file.name}...")
         
         # Load JSON data
-        with open(json_file, 'r', encoding='utf-8') as f:
-            events = json.load(f)
+        events = read_json_file(json_file)
         
         updated_count = 0
+        # Per-file tallies, printed once instead of a line per image
+        matched = case_fixed = missing = unnamed = 0
         
         # Update each event with its images
         for event in events:
@@ -62,7 +114,8 @@ def add_local_paths_to_json(json_folder_path, images_folder_path):
             existing_images = event.get('images', [])
             
             if not existing_images:
-                print(f"  Event {event_id}: No existing images found, skipping")
+                if verbose:
+                    print(f"  Event {event_id}: No existing images found, skipping")
                 continue
             
             # Create relative path from data folder
@@ -87,14 +140,12 @@ def add_local_paths_to_json(json_folder_path, images_folder_path):
                         existing_img['local_path'] = f"{relative_path_normalized}/{existing_filename}"
                         existing_img['filename'] = existing_filename  # Ensure filename is set
                         images_updated += 1
-                        print(f"  Event {event_id}, Image {i+1}: Found and updated path for '{existing_filename}'")
+                        matched += 1
+                        if verbose:
+                            print(f"  Event {event_id}, Image {i+1}: Found and updated path for '{existing_filename}'")
                     else:
                         # Filename not found - try case-insensitive search
-                        found_file = None
-                        for available_filename, image_file in available_images.items():
-                            if available_filename.lower() == existing_filename.lower():
-                                found_file = (available_filename, image_file)
-                                break
+                        found_file = available_images_ci.get(existing_filename.lower())
                         
                         if found_file:
                             # Found with different case - update both filename and path
@@ -102,20 +153,28 @@ def add_local_paths_to_json(json_folder_path, images_folder_path):
                             existing_img['local_path'] = f"{relative_path_normalized}/{correct_filename}"
                             existing_img['filename'] = correct_filename
                             images_updated += 1
-                            print(f"  Event {event_id}, Image {i+1}: Found '{correct_filename}' (case mismatch), updated filename and path")
+                            case_fixed += 1
+                            if verbose:
+                                print(f"  Event {event_id}, Image {i+1}: Found '{correct_filename}' (case mismatch), updated filename and path")
                         else:
-                            print(f"  Event {event_id}, Image {i+1}: Warning - filename '{existing_filename}' not found in images folder")
+                            missing += 1
+                            if verbose:
+                                print(f"  Event {event_id}, Image {i+1}: Warning - filename '{existing_filename}' not found in images folder")
                 else:
                     # No filename in JSON - skip this image
-                    print(f"  Event {event_id}, Image {i+1}: No filename specified, skipping")
+                    unnamed += 1
+                    if verbose:
+                        print(f"  Event {event_id}, Image {i+1}: No filename specified, skipping")
             
             if images_updated > 0:
                 updated_count += 1
         
+        print(f"  Images: {matched} matched, {case_fixed} case-corrected, "
+              f"{missing} not found, {unnamed} without filename")
+        
         # Save updated JSON
         if updated_count > 0:
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(events, f, indent=2, ensure_ascii=False)
+            write_json_file(json_file, events)
             print(f"  Saved {json_file.name} with {updated_count} updated events")
             total_updated += updated_count
         else:
@@ -125,16 +184,17 @@ def add_local_paths_to_json(json_folder_path, images_folder_path):
     return True
 
 if __name__ == "__main__":
-    if len(sys.argv) == 3:
-        json_folder = sys.argv[1]
-        images_folder = sys.argv[2]
+    args = [arg for arg in sys.argv[1:] if arg != "--verbose"]
+    verbose = len(args) != len(sys.argv) - 1
+    if len(args) == 2:
+        json_folder, images_folder = args
     else:
-        print("Usage: python add_image_paths.py [json_folder] [images_folder]")
+        print("Usage: python add_image_paths.py [json_folder] [images_folder] [--verbose]")
         print("\nExamples:")
         print("  python add_image_paths.py data/events_output/20251015_000000 data/events_output/20251015_000000/images")
         print("  python add_image_paths.py data/events_output/20250120_000000 data/events_output/20250120_000000/images")
         sys.exit(1)
     
     print("Adding local_path and filename to existing image objects...")
-    add_local_paths_to_json(json_folder, images_folder)
+    add_local_paths_to_json(json_folder, images_folder, verbose=verbose)
 
@@ -0,0 +1,7 @@
+"""
+pytest configuration.
+
+Keeping this file at the repository root makes pytest put the root on
+sys.path, so tests can import the ``src`` package when run as plain
+``pytest`` as well as ``python -m pytest``.
+"""
@@ -15,6 +15,24 @@ from pathlib import Path
 from typing import List, Dict, Any, Union
 from html import unescape
 
+# Control characters (other than tab, newline and carriage return) to drop
+_CONTROL_CHARS = [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F]
+
+# Single-character fixes applied by clean_text_field after the multi-character
+# encoding fixes, as one str.translate table instead of a chain of .replace calls
+_CLEAN_FIELD_TABLE = str.maketrans({
+    '\u201a': ',',  # Single low-9 quotation mark
+    '\u201e': '"',  # Double low-9 quotation mark
+    '\u2039': '<',  # Single left-pointing angle quotation mark
+    '\u203a': '>',  # Single right-pointing angle quotation mark
+    '\u00ab': '"',  # Left-pointing double angle quotation mark
+    '\u00bb': '"',  # Right-pointing double angle quotation mark
+    '\t': ' ',
+    '\n': ' ',
+    '\r': ' ',
+    **{chr(code): None for code in _CONTROL_CHARS},
+})
+
 
 def normalize_path(path: Union[str, None]) -> str:
     """
@@ -106,18 +124,8 @@ def clean_text_field(text: Union[str, None]) -> str:
     text = text.replace(''', "'")  # Right single quotation mark
     text = text.replace('"', '"')  # Left double quotation mark
     text = text.replace('"', '"')  # Right double quotation mark
-    text = text.replace('‚', ',')  # Single low-9 quotation mark
-    text = text.replace('„', '"')  # Double low-9 quotation mark
-    text = text.replace('‹', '<')  # Single left-pointing angle quotation mark
-    text = text.replace('›', '>')  # Single right-pointing angle quotation mark
-    text = text.replace('«', '"')  # Left-pointing double angle quotation mark
-    text = text.replace('»', '"')  # Right-pointing double angle quotation mark
-    
-    # Remove control characters
-    text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
-    
-    # Normalize whitespace: replace tabs and newlines with spaces
-    text = text.replace('\t', ' ').replace('\n', ' ').replace('\r', ' ')
+    # Remaining quote variants, control characters and tabs/newlines in one pass
+    text = text.translate(_CLEAN_FIELD_TABLE)
     
     # Replace multiple spaces with single space
     text = re.sub(r'\s+', ' ', text)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 import json
@@ -11,6 +12,13 @@ from fuzzywuzzy import fuzz
 # from sentence_transformers import SentenceTransformer, util
 import torch
 import numpy as np
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
 from src.utils import *
 from src.core.blog import Blog
 from src.core.event import Event
@@ -30,6 +38,9 @@ from src.utils.harvest_emails import harvest as harvest_emails_to_excel
 from dataclasses import asdict
 
 EMBEDDING_MODEL = "all-mpnet-base-v2"
+# Rows stored as float16 carry this suffix in event_embeddings.embedding_model
+FP16_SUFFIX = "|fp16"
+EMBEDDING_MODEL_FP16 = EMBEDDING_MODEL + FP16_SUFFIX
 
 # Lazy-loaded model cache
 _sentence_model = None
@@ -48,6 +59,106 @@ def get_cosine_sim():
     from sentence_transformers import util
     return util.cos_sim
 
+def decode_embedding(blob: bytes, embedding_model: str) -> np.ndarray:
+    """Decode a stored embedding blob to float32, honouring the fp16 model suffix."""
+    dtype = np.float16 if embedding_model.endswith(FP16_SUFFIX) else np.float32
+    return np.frombuffer(blob, dtype=dtype).astype(np.float32)
+
+# Rows of the similarity matrix computed at a time on the blockwise paths
+SIMILARITY_BLOCK_SIZE = 1024
+# Below this many events copying to the GPU costs more than the search itself
+GPU_SIMILARITY_MIN_EVENTS = 5000
+# From this many events the FAISS index stores int8 codes instead of float32
+QUANTIZED_SEARCH_MIN_EVENTS = 50000
+# Radius slack for the int8 search so quantization error cannot drop a true pair
+QUANTIZED_SEARCH_MARGIN = 0.02
+
+# Concurrent Places API lookups when geocoding a batch of relevant events
+GEOCODE_WORKERS = 10
+
+def find_similar_pairs(embeddings: np.ndarray, min_sim: float,
+                       candidate_pairs: Optional[set] = None) -> Dict[int, List[tuple]]:
+    """Find every pair of events whose embeddings are at least min_sim similar.
+    
+    Large sets go through a blockwise matmul on CUDA when a GPU is available.
+    Otherwise a FAISS inner-product range search is used when faiss is
+    installed (int8-quantized for very large sets, with the hits rescored
+    exactly), else a blockwise numpy matmul; the full N x N matrix is never held.
+    
+    Args:
+        embeddings (np.ndarray): L2-normalized (N, d) embeddings
+        min_sim (float): Minimum cosine similarity for a pair to be returned
+        candidate_pairs (Optional[set]): If given, only these (i, j) pairs with i < j
+                                         are scored, instead of all pairs
+        
+    Returns:
+        Dict[int, List[tuple]]: For each index i, (j, similarity) pairs with j > i, sorted by j
+    """
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+    pairs: Dict[int, List[tuple]] = {}
+    
+    if candidate_pairs is not None:
+        if not candidate_pairs:
+            return pairs
+        left, right = np.array(sorted(candidate_pairs)).T
+        scores = np.einsum('ij,ij->i', embeddings[left], embeddings[right])
+        for i, j, score in zip(left.tolist(), right.tolist(), scores.tolist()):
+            if score >= min_sim:
+                pairs.setdefault(i, []).append((j, score))
+        return pairs
+    
+    if torch.cuda.is_available() and len(embeddings) >= GPU_SIMILARITY_MIN_EVENTS:
+        # FAISS GPU indexes have no range search, so run the blockwise matmul
+        # on CUDA instead; only the above-threshold hits come back to the host
+        device_embeddings = torch.from_numpy(embeddings).to("cuda")
+        cols = torch.arange(len(embeddings), device="cuda").unsqueeze(0)
+        for start in range(0, len(embeddings), SIMILARITY_BLOCK_SIZE):
+            block = device_embeddings[start:start + SIMILARITY_BLOCK_SIZE] @ device_embeddings.T
+            rows = torch.arange(start, start + block.shape[0], device="cuda").unsqueeze(1)
+            hits = torch.nonzero((block >= min_sim) & (cols > rows))
+            hit_scores = block[hits[:, 0], hits[:, 1]]
+            # nonzero is row-major, so each row's js come out sorted
+            for (offset, j), score in zip(hits.tolist(), hit_scores.tolist()):
+                pairs.setdefault(start + offset, []).append((j, score))
+        return pairs
+    
+    if FAISS_AVAILABLE and len(embeddings) >= QUANTIZED_SEARCH_MIN_EVENTS:
+        # int8 codes cut the index to a quarter of the float32 size and speed
+        # up the scan; search slightly wide, then rescore the hits exactly
+        index = faiss.IndexScalarQuantizer(embeddings.shape[1], faiss.ScalarQuantizer.QT_8bit,
+                                           faiss.METRIC_INNER_PRODUCT)
+        index.train(embeddings)
+        index.add(embeddings)
+        lims, _, ids = index.range_search(embeddings, min_sim - QUANTIZED_SEARCH_MARGIN)
+        approx_pairs = set()
+        for i in range(len(embeddings)):
+            row_ids = ids[lims[i]:lims[i + 1]]
+            approx_pairs.update((i, j) for j in row_ids[row_ids > i].tolist())
+        return find_similar_pairs(embeddings, min_sim, candidate_pairs=approx_pairs)
+    
+    if FAISS_AVAILABLE:
+        index = faiss.IndexFlatIP(embeddings.shape[1])
+        index.add(embeddings)
+        # range_search keeps scores strictly above the radius
+        lims, scores, ids = index.range_search(embeddings, min_sim - 1e-6)
+        for i in range(len(embeddings)):
+            row_ids = ids[lims[i]:lims[i + 1]]
+            row_scores = scores[lims[i]:lims[i + 1]]
+            keep = row_ids > i
+            if keep.any():
+                order = np.argsort(row_ids[keep])
+                pairs[i] = list(zip(row_ids[keep][order].tolist(), row_scores[keep][order].tolist()))
+        return pairs
+    
+    for start in range(0, len(embeddings), SIMILARITY_BLOCK_SIZE):
+        block = embeddings[start:start + SIMILARITY_BLOCK_SIZE] @ embeddings.T
+        for offset, row in enumerate(block):
+            i = start + offset
+            js = np.nonzero(row[i + 1:] >= min_sim)[0] + i + 1
+            if len(js):
+                pairs[i] = list(zip(js.tolist(), row[js].tolist()))
+    return pairs
+
 @dataclass
 class Run:
     """Main orchestrator class for the web scraping and event extraction process.
@@ -117,12 +228,12 @@ class Run:
 
         conn = get_db_connection()
         embeddings_query = """
-            SELECT e.id, e.title, e.venue_name, e.start_datetime, e.end_datetime, emb.embedding
+            SELECT e.id, e.title, e.venue_name, e.start_datetime, e.end_datetime, emb.embedding, emb.embedding_model
             FROM events e
             INNER JOIN event_embeddings emb ON emb.id = e.id
-            WHERE emb.embedding_model = %s
+            WHERE emb.embedding_model IN (%s, %s)
         """
-        df = pd.read_sql_query(embeddings_query, conn, params=[EMBEDDING_MODEL])
+        df = pd.read_sql_query(embeddings_query, conn, params=[EMBEDDING_MODEL, EMBEDDING_MODEL_FP16])
         conn.close()
 
         formatter.print_level2(f"Loaded {len(df)} stored event embeddings from database")
@@ -198,7 +309,7 @@ class Run:
                 continue
             if isinstance(emb_blob, memoryview):
                 emb_blob = emb_blob.tobytes()
-            vector = np.frombuffer(emb_blob, dtype=np.float32)
+            vector = decode_embedding(emb_blob, row.embedding_model)
             if vector.size == 0:
                 continue
             existing_vectors.append(vector)
@@ -354,11 +465,43 @@ class Run:
         
         return unique_events
     
-    def _deduplicate_within_batch(self, events: List[Event], sim_threshold: float = 0.85) -> List[Event]:
-        """Deduplicate events within the same batch/article using semantic similarity with venue matching."""
+    def _deduplicate_within_batch(self, events: List[Event], sim_threshold: float = 0.85,
+                                  embeddings: Optional[np.ndarray] = None) -> List[Event]:
+        """Deduplicate events within the same batch/article using semantic similarity with venue matching.
+        
+        Args:
+            events (List[Event]): Events to deduplicate, in priority order (earlier events are kept)
+            sim_threshold (float): Similarity at or above which events are duplicates regardless of venue
+            embeddings (Optional[np.ndarray]): Precomputed L2-normalized embeddings aligned with events.
+                                               If None, the events are encoded here.
+        """
         if len(events) <= 1:
             return events
         
+        duplicate_of = self._find_batch_duplicates(events, sim_threshold=sim_threshold, embeddings=embeddings)
+        
+        # Return only unique events
+        return [e for idx, e in enumerate(events) if idx not in duplicate_of]
+    
+    def _find_batch_duplicates(self, events: List[Event], sim_threshold: float = 0.85,
+                               embeddings: Optional[np.ndarray] = None,
+                               candidate_pairs: Optional[set] = None) -> Dict[int, int]:
+        """Find duplicates within a batch, keeping the earliest event of each group.
+        
+        Args:
+            events (List[Event]): Events to compare, in priority order (earlier events are kept)
+            sim_threshold (float): Similarity at or above which events are duplicates regardless of venue
+            embeddings (Optional[np.ndarray]): Precomputed L2-normalized embeddings aligned with events.
+                                               If None, the events are encoded here.
+            candidate_pairs (Optional[set]): Restrict comparison to these (i, j) index pairs (i < j),
+                                             e.g. from a blocking prefilter. If None, all pairs are considered.
+        
+        Returns:
+            Dict[int, int]: Index of each duplicate event mapped to the index of the event kept instead
+        """
+        if len(events) <= 1:
+            return {}
+        
         def normalize_venue_name(venue: str) -> str:
             """Normalize venue name for comparison (lowercase, remove punctuation, extra spaces)"""
             if not venue:
@@ -371,30 +514,32 @@ class Run:
             normalized = ' '.join(normalized.split())  # Normalize whitespace
             return normalized
         
-        # Combine text for each event - match the format used for database embeddings
-        texts = [
-            " ".join(filter(None, (e.title or '', e.blurb or '', e.description or ''))).strip() or " "
-            for e in events
-        ]
-        
-        # Use cached model
-        model = get_sentence_model()
-        embeddings = model.encode(texts, convert_to_tensor=True, show_progress_bar=False, batch_size=32)
+        if embeddings is None:
+            # Combine text for each event - match the format used for database embeddings
+            texts = [
+                " ".join(filter(None, (e.title or '', e.blurb or '', e.description or ''))).strip() or " "
+                for e in events
+            ]
+            
+            # Use cached model
+            model = get_sentence_model()
+            embeddings = model.encode(texts, convert_to_numpy=True, normalize_embeddings=True,
+                                      show_progress_bar=False, batch_size=32)
         
-        # Find duplicates using similarity matrix
-        cos_sim = get_cosine_sim()
-        similarity_matrix = cos_sim(embeddings, embeddings)
-        to_remove = set()
+        # No rule below accepts a pair under 75% similarity (or sim_threshold if lower),
+        # so only candidate pairs above that floor need to be checked
+        similar_pairs = find_similar_pairs(embeddings, min(sim_threshold, 0.75), candidate_pairs=candidate_pairs)
+        venues = [normalize_venue_name(e.venue_name) for e in events]
+        duplicate_of: Dict[int, int] = {}
         
         for i in range(len(events)):
-            if i in to_remove:
+            if i in duplicate_of:
                 continue
-            venue_i = normalize_venue_name(events[i].venue_name)
-            for j in range(i + 1, len(events)):
-                if j in to_remove:
+            venue_i = venues[i]
+            for j, similarity in similar_pairs.get(i, []):
+                if j in duplicate_of:
                     continue
-                similarity = float(similarity_matrix[i][j])
-                venue_j = normalize_venue_name(events[j].venue_name)
+                venue_j = venues[j]
                 venue_matches = venue_i and venue_j and venue_i == venue_j
                 
                 # Determine if duplicate: be careful with same venue having different events
@@ -416,11 +561,10 @@ class Run:
                 
                 if is_duplicate:
                     # Keep the first one, remove the duplicate
-                    to_remove.add(j)
+                    duplicate_of[j] = i
                     formatter.print_level3(f"[BATCH DUP] {events[i].title} ↔ {events[j].title} ({similarity:.2%}, {match_reason})")
         
-        # Return only unique events
-        return [e for idx, e in enumerate(events) if idx not in to_remove]
+        return duplicate_of
 
 
     def setup_directories(self) -> None:
@@ -565,15 +709,27 @@ class Run:
         
         formatter.print_success(f"Relevant: {len(relevant)}, Non-relevant: {len(irrelevant)}")
         
+        # Geocode every relevant event up front: the Places lookups are
+        # independent network calls, so they overlap on a thread pool.
+        # Events sharing a venue are looked up once.
+        event_by_venue = {}
+        for ev in relevant:
+            event_by_venue.setdefault(ev.venue_name, ev)
+        with ThreadPoolExecutor(max_workers=GEOCODE_WORKERS) as executor:
+            address_by_venue = dict(zip(
+                event_by_venue,
+                executor.map(lambda ev: ev.get_address_n_coord(), event_by_venue.values()),
+            ))
+        address_results = [address_by_venue[ev.venue_name] for ev in relevant]
+        
         # Assign IDs and process each relevant event
-        for event_obj in relevant:
+        for event_obj, add_coord_result in zip(relevant, address_results):
             if not getattr(event_obj, "id", None):
                 event_obj.id = get_next_event_id()
             
             formatter.print_level2(f"Processing: {event_obj.title[:40]}...")
             
-            # Get address and coordinates
-            add_coord_result = event_obj.get_address_n_coord()
+            # Apply address and coordinates
             if add_coord_result:
                 event_obj.address_display, event_obj.latitude, event_obj.longitude = add_coord_result
                 formatter.print_success(f"  Address: {event_obj.address_display[:50]}...", level=3)
@@ -12,6 +12,7 @@ Supports:
 """
 
 import json
+import re
 import time
 import os
 from pathlib import Path
@@ -24,6 +25,7 @@ from google.genai.types import GenerateContentConfig
 
 try:
     from playwright.sync_api import sync_playwright
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
@@ -35,6 +37,15 @@ load_dotenv()
 DEFAULT_MAX_ARTICLES = 5
 RATE_LIMIT = 2.0
 GEMINI_MODEL = "gemini-2.0-flash"
+# Article pages are read as soon as one of these is in the DOM,
+# waiting at most ARTICLE_RENDER_TIMEOUT_MS after DOMContentLoaded
+ARTICLE_READY_SELECTOR = "article, main, h1"
+ARTICLE_RENDER_TIMEOUT_MS = 5000
+
+# Case-insensitive markers of a Cloudflare block page, matched on the raw HTML
+# so the (often multi-MB) page is never copied just to lowercase it
+CLOUDFLARE_RE = re.compile(r"cloudflare", re.I)
+BLOCKED_RE = re.compile(r"blocked", re.I)
 
 # Paths to config files (same as RSS flow)
 CONFIG_DIR = Path("config")
@@ -123,7 +134,7 @@ class CategoryScraper:
                 page.close()
             
             # Check for Cloudflare block
-            if "cloudflare" in html.lower() and "blocked" in html.lower():
+            if CLOUDFLARE_RE.search(html) and BLOCKED_RE.search(html):
                 print("❌ Cloudflare is blocking access to this site.")
                 print("   Try using RSS feed instead, or manually copy article URLs.")
                 context.close()
@@ -282,8 +293,13 @@ class CategoryScraper:
                     page = context.new_page()
                     # Try domcontentloaded first (faster, more reliable)
                     page.goto(url, timeout=30000, wait_until="domcontentloaded")
-                    # Shorter wait time to reduce connection issues
-                    page.wait_for_timeout(2000)  # Give time for JS to render
+                    # Wait for the content we parse rather than a fixed delay;
+                    # on a timeout, read whatever has rendered so far
+                    try:
+                        page.wait_for_selector(ARTICLE_READY_SELECTOR, state="attached",
+                                               timeout=ARTICLE_RENDER_TIMEOUT_MS)
+                    except PlaywrightTimeoutError:
+                        pass
                     html = page.content()
                     page.close()
                     page = None
@@ -30,12 +30,18 @@ Example Usage:
 """
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 import os
 import json
 from pathlib import Path
 from dataclasses import dataclass, field
 from src.utils.config import config
 
+# Large files (e.g. merged event JSON) are split into parts uploaded concurrently
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+MAX_UPLOAD_CONCURRENCY = 16
+
 @dataclass
 class S3:
     """
@@ -55,12 +61,14 @@ class S3:
         aws_access_key (str): AWS access key for authentication
         aws_secret_key (str): AWS secret key for authentication
         s3 (boto3.client): Boto3 S3 client instance
+        transfer_config (TransferConfig): Multipart settings used for uploads
     """
     bucket: str = field(init=False)
     region: str = field(init=False)
     aws_access_key: str = field(init=False)
     aws_secret_key: str = field(init=False)
     s3: object = field(init=False)
+    transfer_config: TransferConfig = field(init=False)
 
     def __post_init__(self):
         """
@@ -80,6 +88,12 @@ class S3:
             aws_secret_access_key=self.aws_secret_key,
             region_name=self.region
         )
+        self.transfer_config = TransferConfig(
+            multipart_threshold=MULTIPART_THRESHOLD,
+            multipart_chunksize=MULTIPART_CHUNKSIZE,
+            max_concurrency=MAX_UPLOAD_CONCURRENCY,
+            use_threads=True,
+        )
 
     def upload_directory(self, local_path, base_dir=None):
         """
@@ -113,7 +127,7 @@ class S3:
                     relative_path_str = str(relative_path).replace("\\", "/")
                     s3_key = f"{s3_prefix}/{relative_path_str}"
                     print(f"Uploading {path} to s3://{self.bucket}/{s3_key}")
-                    self.s3.upload_file(str(path), self.bucket, s3_key)
+                    self.s3.upload_file(str(path), self.bucket, s3_key, Config=self.transfer_config)
                 except ValueError:
                     print(f"Warning: {path} is not relative to {base_dir}, skipping...")
                     continue
@@ -147,7 +161,7 @@ class S3:
         else:
             s3_key = f"{s3_prefix}/{local_path.name}"
         print(f"Uploading {local_path} to s3://{self.bucket}/{s3_key}")
-        self.s3.upload_file(str(local_path), self.bucket, s3_key)
+        self.s3.upload_file(str(local_path), self.bucket, s3_key, Config=self.transfer_config)
 
     def view_file_content(self, file_path):
         """
@@ -38,17 +38,91 @@ PREFERRED_HANDLES = [
 ]
 
 
-def fetch_html(url: str, use_js=False) -> Optional[str]:
-    """Fetch page HTML, optionally with Playwright for JS-heavy sites."""
+class SharedBrowser:
+    """Headless Firefox launched on first use and reused for every later JS fetch.
+
+    Each fetch gets its own browser context, so pages stay isolated while the
+    browser launch is paid once per batch instead of once per URL.
+
+    With cdp_url (e.g. "http://localhost:9222" of a Chromium started with
+    --remote-debugging-port=9222), it attaches to that long-lived browser
+    instead of launching one; close() then only disconnects.
+    """
+
+    def __init__(self, cdp_url: Optional[str] = None):
+        self.cdp_url = cdp_url
+        self._playwright = None
+        self._browser = None
+
+    def get(self):
+        if self._browser is None:
+            self._playwright = sync_playwright().start()
+            if self.cdp_url:
+                self._browser = self._playwright.chromium.connect_over_cdp(self.cdp_url)
+            else:
+                self._browser = self._playwright.firefox.launch(headless=True)
+        return self._browser
+
+    def is_disconnected(self) -> bool:
+        """True once a started browser has crashed or its CDP connection dropped."""
+        return self._browser is not None and not self._browser.is_connected()
+
+    def restart(self) -> None:
+        """Discard a dead browser so the next get() launches (or reconnects) a fresh one."""
+        browser, playwright = self._browser, self._playwright
+        self._browser = None
+        self._playwright = None
+        # Best-effort cleanup: the browser is already gone, so closing may fail
+        for shutdown in (browser and browser.close, playwright and playwright.stop):
+            if shutdown:
+                try:
+                    shutdown()
+                except Exception:
+                    pass
+
+    def close(self) -> None:
+        # For a CDP-connected browser this drops our contexts and disconnects,
+        # leaving the shared browser running
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+    def __enter__(self) -> "SharedBrowser":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def render_html(browser, url: str) -> str:
+    """Load url in a fresh context of an already running browser and return its HTML."""
+    context = browser.new_context()
+    try:
+        page = context.new_page()
+        page.goto(url, timeout=30000)
+        return page.content()
+    finally:
+        context.close()
+
+
+def fetch_html(url: str, use_js=False, browser: Optional[SharedBrowser] = None) -> Optional[str]:
+    """Fetch page HTML, optionally with Playwright for JS-heavy sites.
+
+    Pass a SharedBrowser when fetching many pages so Firefox is launched once.
+    Failing to launch or connect that shared browser raises instead of
+    returning None, so callers can tell a broken browser from a page without HTML.
+    """
+    if use_js and PLAYWRIGHT_AVAILABLE and browser is not None:
+        running_browser = browser.get()
     try:
         if use_js and PLAYWRIGHT_AVAILABLE:
-            with sync_playwright() as p:
-                browser = p.firefox.launch(headless=True)
-                page = browser.new_page()
-                page.goto(url, timeout=30000)
-                html = page.content()
-                browser.close()
-                return html
+            if browser is not None:
+                return render_html(running_browser, url)
+            with SharedBrowser() as own_browser:
+                return render_html(own_browser.get(), url)
         else:
             res = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
             if "text/html" in res.headers.get("Content-Type", ""):
@@ -93,13 +167,14 @@ def filter_priority_emails(emails: Set[str]) -> List[str]:
     return list(emails)
 
 
-def scrape_event_emails(start_url: str, use_js=False) -> List[str]:
+def scrape_event_emails(start_url: str, use_js=False, browser: Optional[SharedBrowser] = None) -> List[str]:
     """Main entry — crawl contact pages, collect prioritized emails.
     
     Optimized for speed:
     - Try simple request first, only use JS if needed
     - Stop early if good emails found on first page
     - Limit number of links followed
+    - Reuse the caller's SharedBrowser for the JS fallback, if given
     """
     visited = set()
     found_emails = set()
@@ -138,7 +213,7 @@ def scrape_event_emails(start_url: str, use_js=False) -> List[str]:
     
     # If still no emails and JS is requested, try with Playwright (slower)
     if not found_emails and use_js and PLAYWRIGHT_AVAILABLE:
-        html = fetch_html(start_url, use_js=True)
+        html = fetch_html(start_url, use_js=True, browser=browser)
         if html:
             found_emails |= extract_emails(html)
     
@@ -37,7 +37,11 @@ Example Usage:
     longitude, latitude = get_coordinates_from_address("1 Marina Bay Sands, Singapore")
 """
 
+import threading
+from functools import lru_cache
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from src.utils.config import config  
 from pathlib import Path
@@ -54,6 +58,26 @@ import re
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
+# Distinct queries remembered per process; many events share the same venue
+PLACES_CACHE_SIZE = 4096
+
+# Keep-alive sessions for Places calls, one per thread: requests.Session is not
+# documented as thread-safe, and geocoding runs on a thread pool. Each thread
+# still sets up TLS to the API once and reuses the connection afterwards.
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Return this thread's Places API session, creating it on first use."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        _thread_local.session = session
+    return session
+
+
+@lru_cache(maxsize=PLACES_CACHE_SIZE)
 def googlePlace_searchText(query: str):
     """
     Search for places using Google Places API with text query.
@@ -68,6 +92,9 @@ def googlePlace_searchText(query: str):
     - Requesting formatted addresses and location coordinates
     - Using English language for consistent results
     
+    Results are cached per query for the life of the process, so repeated
+    venues cost one API call. Callers must not modify the returned dict.
+    
     Args:
         query (str): Text query to search for places (e.g., venue names, addresses)
         
@@ -102,7 +129,7 @@ def googlePlace_searchText(query: str):
     }
 
     # Make API request to Google Places API
-    response = requests.post(
+    response = _get_session().post(
             url = config.googlePlace.searchTextURL, 
             headers=headers,
             json=body
@@ -193,10 +220,6 @@ def get_coordinates_from_address(address):
             latitude = location.get('latitude')
             
             return longitude, latitude
-        if longitude and latitude:
-            district, area = which_district(longitude, latitude)
-            planning_area = district
-            region = area
 
     except Exception as e:
         print(f"Error getting coordinates for address '{address}': {str(e)}")
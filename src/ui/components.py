@@ -7,7 +7,7 @@ the application interface.
 
 """
 
-import base64
+import io
 import streamlit as st
 from pathlib import Path
 from datetime import date, time
@@ -16,15 +16,17 @@ from typing import Dict, List, Any, Optional, Tuple
 from src.ui.constants import (
     AVAILABLE_CATEGORIES, ACTIVITY_OR_EVENT, SPECIAL_FIELDS, DISABLED_FIELDS,
     ASPECT_RATIOS, IMAGE_DISPLAY_BASE_WIDTH, THUMBNAIL_PREVIEW_WIDTH,
-    SUPPORTED_IMAGE_TYPES, MAX_IMAGES_PER_EVENT
+    SUPPORTED_IMAGE_TYPES, MAX_IMAGES_PER_EVENT, DYNAMIC_FIELDS_PER_ROW
 )
 from src.ui.helpers import (
     get_image_display_params, parse_iso_datetime, combine_to_iso_datetime,
-    validate_image_count, calculate_pagination, filter_events_by_search
+    validate_image_count, calculate_pagination, filter_events_by_search,
+    format_json_text
 )
 
 import os
-from PIL import Image, UnidentifiedImageError
+import sys
+from PIL import Image, ImageOps, UnidentifiedImageError
 MIN_DATE = date(1970, 1, 1)
 MAX_DATE = date(2099, 12, 31)
 def clamp_date(d):
@@ -32,19 +34,64 @@ def clamp_date(d):
         return date.today()
     return min(MAX_DATE, max(MIN_DATE,d))
 
+@st.cache_data(max_entries=256, show_spinner=False)
+def load_display_image(image_path: str, file_mtime: float, width: int,
+                       height: Optional[int] = None) -> Tuple[bytes, str]:
+    """
+    Decode an image once per file version and size it for display.
+    
+    Streamlit reruns the page on every interaction; caching on (path, mtime,
+    size) means each image is decoded, validated and resized once instead of
+    on every rerun, and the browser receives a display-sized copy rather than
+    the full-resolution file. EXIF orientation is applied before resizing.
+    Images with transparency are kept as PNG, all
+    others are re-encoded as JPEG.
+    
+    Args:
+        image_path (str): Path to the image file
+        file_mtime (float): File modification time, used only as a cache key
+        width (int): Display width in pixels
+        height (Optional[int]): Display height; when given, the image is
+            center-cropped to width x height (like CSS object-fit: cover),
+            otherwise it keeps its own aspect ratio and is only scaled down
+            to at most width pixels wide
+        
+    Returns:
+        Tuple[bytes, str]: (encoded image bytes, MIME type)
+        
+    Raises:
+        Exception: If the file cannot be read as an image (not cached, so a
+            replaced file is picked up on the next rerun)
+    """
+    with Image.open(image_path) as img:
+        img.load()  # Full decode, so truncated/corrupted files fail here
+        # Re-encoding drops EXIF, so bake the orientation into the pixels first
+        img = ImageOps.exif_transpose(img)
+        if height:
+            img = ImageOps.fit(img, (width, height))
+        else:
+            # Bound the width only; tall images keep their full display height
+            img.thumbnail((width, sys.maxsize))
+        buffer = io.BytesIO()
+        if img.mode in ("RGBA", "LA", "P"):
+            img.save(buffer, "PNG", optimize=True)
+            return buffer.getvalue(), "image/png"
+        img.convert("RGB").save(buffer, "JPEG", quality=85, optimize=True)
+        return buffer.getvalue(), "image/jpeg"
+
+
 def display_image_with_aspect_ratio(image_path: str, aspect_ratio: str = "Original", base_width: int = IMAGE_DISPLAY_BASE_WIDTH) -> None:
     """
     Display an image with the specified aspect ratio.
     
-    Renders an image with precise aspect ratio control using either CSS styling
-    or native Streamlit image display. Supports multiple image formats and
-    provides fallback handling for various error conditions.
+    Renders an image with precise aspect ratio control by cropping it once
+    (cached) and displaying it with native Streamlit image display. Supports
+    multiple image formats and provides fallback handling for various error
+    conditions.
     
     The function provides:
-    - CSS-based aspect ratio control for consistent display
-    - Automatic image format detection and MIME type handling
-    - Base64 encoding for HTML display
-    - Fallback to native Streamlit display for original aspect ratio
+    - Center-crop aspect ratio control for consistent display
+    - Cached, display-sized image bytes served by Streamlit's media endpoint
     - Comprehensive error handling for missing or corrupted files
     
     Args:
@@ -55,92 +102,45 @@ def display_image_with_aspect_ratio(image_path: str, aspect_ratio: str = "Origin
     Example:
         display_image_with_aspect_ratio("event_image.jpg", "16:9", 800)
     """
-    # Check if file exists first
+    # The mtime lookup doubles as the existence check (one stat per image)
     img_path = Path(image_path)
-    if not img_path.exists():
+    try:
+        file_mtime = img_path.stat().st_mtime
+    except (FileNotFoundError, NotADirectoryError):
         st.warning(f"Image file not found: {image_path}")
         return
     
-    # Validate that the file is actually a valid image
+    params = get_image_display_params(aspect_ratio, base_width)
+    
+    # Validate that the file is actually a valid image (decoded, cropped to the
+    # aspect ratio and resized once per file version, see load_display_image)
     try:
-        from PIL import Image
-        # Try to open and verify the image
-        # Note: verify() closes the file, so we need to reopen after verification
-        with open(img_path, "rb") as f:
-            img = Image.open(f)
-            img.verify()  # Verify it's a valid image (this closes the file)
-        # Reopen for actual use (verify closes the file)
-        with open(img_path, "rb") as f:
-            Image.open(f)  # Just check we can open it again
+        img_bytes, mime_type = load_display_image(str(img_path), file_mtime, params["width"], params["height"])
     except Exception as img_error:
         st.warning(f"⚠️ Invalid or corrupted image file: {img_path.name}")
         st.info(f"💡 The file exists but cannot be read as an image. Error: {str(img_error)}")
         return
     
-    params = get_image_display_params(aspect_ratio, base_width)
-    if params["css_style"]:
-        # Use HTML/CSS for aspect ratio control
-        try:
-            # Read and encode image
-            with open(image_path, "rb") as img_file:
-                img_data = base64.b64encode(img_file.read()).decode()
-            
-            # Determine image format
-            img_format = Path(image_path).suffix.lower()
-            if img_format in ['.jpg', '.jpeg']:
-                mime_type = 'image/jpeg'
-            elif img_format == '.png':
-                mime_type = 'image/png'
-            elif img_format == '.webp':
-                mime_type = 'image/webp'
-            else:
-                mime_type = 'image/jpeg'  # default
-            
-            # Create HTML with styled image (no caption)
-            html_content = f"""
-            <div style="text-align: center; margin: 10px 0;">
-                <img src="data:{mime_type};base64,{img_data}" 
-                     style="{params['css_style']}" 
-                     alt="">
-            </div>
-            """
-            st.markdown(html_content, unsafe_allow_html=True)
-        except Exception as e:
-            error_msg = str(e)
-            if "MediaFileStorageError" in error_msg or "Bad filename" in error_msg:
-                st.warning(f"⚠️ Image file reference is invalid: {Path(image_path).name}")
-                st.info("💡 The image file may have been moved or deleted. Please update the image path.")
-            elif "BytesIO" in error_msg or "cannot identify image" in error_msg.lower():
-                st.warning(f"⚠️ Cannot read image file: {Path(image_path).name}")
-                st.info("💡 The image file may be corrupted or in an unsupported format. Try replacing the image file.")
-            else:
-                st.warning(f"Cannot display image: {image_path} ({error_msg})")
-            # Don't try fallback if we already know the image is invalid
-            if "BytesIO" not in error_msg and "cannot identify image" not in error_msg.lower():
-                try:
-                    st.image(image_path, width=params["width"], use_container_width=params["use_container_width"])
-                except Exception:
-                    pass  # Already handled above
-    else:
-        # Use regular st.image for original aspect ratio (no caption)
-        # Check if file exists first
-        if not Path(image_path).exists():
-            st.warning(f"Image file not found: {image_path}")
+    # img_bytes are already encoded at the display size, so naming their
+    # format lets st.image pass them through instead of re-encoding, and the
+    # browser fetches them from Streamlit's media endpoint (no inline base64)
+    output_format = "PNG" if mime_type == "image/png" else "JPEG"
+    try:
+        st.image(img_bytes, width=params["width"], use_container_width=params["use_container_width"],
+                 output_format=output_format)
+    except Exception as e:
+        # Catch all exceptions including MediaFileStorageError
+        error_msg = str(e)
+        if "MediaFileStorageError" in error_msg or "Bad filename" in error_msg:
+            st.warning(f"⚠️ Image file reference is invalid: {Path(image_path).name}")
+            st.info("💡 The image file may have been moved or deleted. Please update the image path.")
+        elif "BytesIO" in error_msg or "cannot identify image" in error_msg.lower():
+            st.warning(f"⚠️ Cannot read image file: {Path(image_path).name}")
+            st.info("💡 The image file may be corrupted or in an unsupported format. Try replacing the image file using the 'Replace image file' option above.")
         else:
-            try:
-                st.image(image_path, width=params["width"], use_container_width=params["use_container_width"])
-            except Exception as e:
-                # Catch all exceptions including MediaFileStorageError
-                error_msg = str(e)
-                if "MediaFileStorageError" in error_msg or "Bad filename" in error_msg:
-                    st.warning(f"⚠️ Image file reference is invalid: {Path(image_path).name}")
-                    st.info("💡 The image file may have been moved or deleted. Please update the image path.")
-                elif "BytesIO" in error_msg or "cannot identify image" in error_msg.lower():
-                    st.warning(f"⚠️ Cannot read image file: {Path(image_path).name}")
-                    st.info("💡 The image file may be corrupted or in an unsupported format. Try replacing the image file using the 'Replace image file' option above.")
-                else:
-                    st.warning(f"Cannot display image: {image_path} ({error_msg})")
-            
+            st.warning(f"Cannot display image: {image_path} ({error_msg})")
+
+
 def render_aspect_ratio_selector() -> str:
     """
     Render the aspect ratio selector dropdown.
@@ -264,6 +264,65 @@ def render_event_header(event_idx: int, is_checked: bool) -> Tuple[bool, bool]:
     return new_checked, delete_requested
 
 
+def _render_dynamic_field(key: str, value: Any, unique_id: str) -> Any:
+    """Render the input widget for one non-special event field, chosen by its value type."""
+    if isinstance(value, bool):
+        return st.radio(
+            key,
+            options=[True, False],
+            index=0 if value else 1,
+            key=f"form_{key}_{unique_id}",
+            format_func=lambda x: 'Yes' if x else 'No',
+            horizontal=True,
+            disabled=key in DISABLED_FIELDS
+        )
+    elif isinstance(value, (int, float)):
+        return st.number_input(
+            key,
+            value=float(value) if value is not None else 0.0,
+            key=f"form_{key}_{unique_id}",
+            disabled=key in DISABLED_FIELDS
+        )
+    elif isinstance(value, list):
+        list_str = format_json_text(value) if value else "[]"
+        return st.text_area(
+            key,
+            value=list_str,
+            height=80,
+            help="Edit as JSON array format",
+            key=f"form_{key}_{unique_id}",
+            disabled=key in DISABLED_FIELDS
+        )
+    elif isinstance(value, dict):
+        dict_str = format_json_text(value) if value else "{}"
+        return st.text_area(
+            key,
+            value=dict_str,
+            height=120,
+            help="Edit as JSON object format",
+            key=f"form_{key}_{unique_id}",
+            disabled=key in DISABLED_FIELDS
+        )
+    else:
+        return st.text_input(
+            key,
+            value=str(value) if value is not None else "",
+            key=f"form_{key}_{unique_id}",
+            disabled=key in DISABLED_FIELDS
+        )
+
+
+def _render_dynamic_field_row(fields: List[Tuple[str, Any]], form_data: Dict[str, Any], unique_id: str) -> None:
+    """Render up to DYNAMIC_FIELDS_PER_ROW scalar fields side by side under one divider."""
+    if not fields:
+        return
+    st.markdown("---")
+    cols = st.columns(DYNAMIC_FIELDS_PER_ROW)
+    for col, (key, value) in zip(cols, fields):
+        with col:
+            form_data[key] = _render_dynamic_field(key, value, unique_id)
+
+
 def render_event_form(event: Dict, unique_id: str) -> Optional[Dict[str, Any]]:
     """
     Render the event editing form and return form data.
@@ -541,55 +600,23 @@ def render_event_form(event: Dict, unique_id: str) -> Optional[Dict[str, Any]]:
                     key=f"form_address_display_{unique_id}"
                 )
         
-        # Handle dynamic fields
+        # Handle dynamic fields. Scalar fields are packed DYNAMIC_FIELDS_PER_ROW to a row;
+        # list/dict fields keep a full-width row for their JSON text areas.
         event_form_display = {k: v for k, v in event_without_images.items() if k not in SPECIAL_FIELDS}
         
+        scalar_row = []
         for key, value in event_form_display.items():
-            st.markdown("---")
-            if isinstance(value, bool):
-                form_data[key] = st.radio(
-                    key,
-                    options=[True, False],
-                    index=0 if value else 1,
-                    key=f"form_{key}_{unique_id}",
-                    format_func=lambda x: 'Yes' if x else 'No',
-                    horizontal=True,
-                    disabled=key in DISABLED_FIELDS
-                )
-            elif isinstance(value, (int, float)):
-                form_data[key] = st.number_input(
-                    key,
-                    value=float(value) if value is not None else 0.0,
-                    key=f"form_{key}_{unique_id}",
-                    disabled=key in DISABLED_FIELDS
-                )
-            elif isinstance(value, list):
-                list_str = json.dumps(value, indent=2, ensure_ascii=False) if value else "[]"
-                form_data[key] = st.text_area(
-                    key,
-                    value=list_str,
-                    height=80,
-                    help="Edit as JSON array format",
-                    key=f"form_{key}_{unique_id}",
-                    disabled=key in DISABLED_FIELDS
-                )
-            elif isinstance(value, dict):
-                dict_str = json.dumps(value, indent=2, ensure_ascii=False) if value else "{}"
-                form_data[key] = st.text_area(
-                    key,
-                    value=dict_str,
-                    height=120,
-                    help="Edit as JSON object format",
-                    key=f"form_{key}_{unique_id}",
-                    disabled=key in DISABLED_FIELDS
-                )
+            if isinstance(value, (list, dict)):
+                _render_dynamic_field_row(scalar_row, form_data, unique_id)
+                scalar_row = []
+                st.markdown("---")
+                form_data[key] = _render_dynamic_field(key, value, unique_id)
             else:
-                form_data[key] = st.text_input(
-                    key,
-                    value=str(value) if value is not None else "",
-                    key=f"form_{key}_{unique_id}",
-                    disabled=key in DISABLED_FIELDS
-                )
+                scalar_row.append((key, value))
+                if len(scalar_row) == DYNAMIC_FIELDS_PER_ROW:
+                    _render_dynamic_field_row(scalar_row, form_data, unique_id)
+                    scalar_row = []
+        _render_dynamic_field_row(scalar_row, form_data, unique_id)
         
         # Handle datetime fields specially
         start_date = st.session_state.get(f"form_start_datetime_date_{unique_id}")
@@ -691,7 +718,8 @@ def render_page_header(pagination_info: Dict[str, int]) -> None:
         st.rerun()
 
 
-def render_search_section(events: List[Dict], search_term: str = "", case_sensitive: bool = False) -> Tuple[str, bool, List[Dict]]:
+def render_search_section(events: List[Dict], search_term: str = "", case_sensitive: bool = False,
+                          title_index: Optional[List[str]] = None) -> Tuple[str, bool, List[Dict]]:
     """
     Render the search section with input field.
     
@@ -708,6 +736,7 @@ def render_search_section(events: List[Dict], search_term: str = "", case_sensit
         events (List[Dict]): List of all events
         search_term (str): Current search term
         case_sensitive (bool): Whether search is case sensitive (always False now)
+        title_index (Optional[List[str]]): Precomputed build_title_search_index(events)
         
     Returns:
         Tuple[str, bool, List[Dict]]: (new_search_term, new_case_sensitive, filtered_events)
@@ -729,7 +758,7 @@ def render_search_section(events: List[Dict], search_term: str = "", case_sensit
     
     # Filter events based on search
     if new_search_term.strip():
-        filtered_events = filter_events_by_search(events, new_search_term, new_case_sensitive)
+        filtered_events = filter_events_by_search(events, new_search_term, new_case_sensitive, title_index)
         
         # Show search results summary
         st.info(f"🔍 Found {len(filtered_events)} event(s) matching '{new_search_term}'")
@@ -740,6 +769,3 @@ def render_search_section(events: List[Dict], search_term: str = "", case_sensit
         filtered_events = events
     
     return new_search_term, new_case_sensitive, filtered_events
-
-
-import json  # Import needed for the dynamic fields handling 
\ No newline at end of file
@@ -39,7 +39,20 @@ def load_attraction_schema():
 
 # Load schema and extract constants
 event_schema = load_event_schema()
-attr_schema  = load_attraction_schema()
+
+
+def __getattr__(name):
+    """
+    Load attr_schema on first access.
+    
+    The attractions file is generated output rather than part of the repo, so
+    reading it at import time would make every importer of this module
+    (including tests) fail on a fresh checkout.
+    """
+    if name == "attr_schema":
+        value = globals()["attr_schema"] = load_attraction_schema()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 ### Event Schema Constants
 # Available categories for event classification - ONLY these 5 are allowed
@@ -63,6 +76,9 @@ MAX_IMAGES_PER_EVENT = 10
 # Default number of events to display per page
 DEFAULT_EVENTS_PER_PAGE = 10
 
+# Seconds a cached folder/JSON-file listing is reused before the disk is re-scanned
+FOLDER_LISTING_TTL_SECONDS = 60
+
 # Default aspect ratio for image display
 DEFAULT_ASPECT_RATIO = "Original"
 
@@ -76,6 +92,9 @@ DATA_DIR = Path("data")
 # Directory for storing event output files
 EVENTS_OUTPUT_DIR = DATA_DIR / "events_output"
 
+# Organizer emails spreadsheet written by src.utils.harvest_emails
+EMAILS_FILE = DATA_DIR / "emails.xlsx"
+
 # Directory containing configuration files
 CONFIG_DIR = Path("config")
 
@@ -101,6 +120,9 @@ SPECIAL_FIELDS = [
 # These fields are automatically generated and shouldn't be edited manually
 DISABLED_FIELDS = ['guid', 'scraped_on', 'latitude', 'longitude']
 
+# Number of scalar (non-list/dict) dynamic fields placed side by side per form row
+DYNAMIC_FIELDS_PER_ROW = 3
+
 # Image Display Configuration
 # Available aspect ratios for image display
 ASPECT_RATIOS = ["Original", "4:3", "16:9"]
@@ -13,7 +13,7 @@ import streamlit as st
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 
-from src.ui.constants import EVENTS_OUTPUT_DIR, MAX_IMAGES_PER_EVENT
+from src.ui.constants import DATA_DIR, EVENTS_OUTPUT_DIR, MAX_IMAGES_PER_EVENT
 from src.ui.helpers import (
     extract_image_index, get_existing_indexes, sort_images_by_index,
     generate_image_filename, get_next_available_image_index,
@@ -84,11 +84,15 @@ class EventManager:
         
         save_events_to_file(events_to_save, self.file_path)
         
-        # Update session state cache if we're in a Streamlit context
+        # Update session state cache if we're in a Streamlit context. Recording
+        # the new mtime as well lets the next rerun keep using these in-memory
+        # events instead of re-reading and re-parsing the file just written.
         try:
             import streamlit as st
-            session_key = f"events_{self.file_path.name}_{self.file_path.stat().st_mtime}"
+            file_mtime = self.file_path.stat().st_mtime
+            session_key = f"events_{self.file_path.name}_{file_mtime}"
             st.session_state[session_key] = self.events  # Keep unique_id in cache
+            st.session_state[f"file_mtime_{self.file_path.name}"] = file_mtime
         except:
             # Not in Streamlit context, ignore
             pass
@@ -158,9 +162,11 @@ class EventManager:
                 original_event, updated_data, latitude, longitude
             )
             
-            # Save the updated event
-            self.events[event_idx] = updated_event_data
-            self.save_events()
+            # Save the updated event; a form submitted without edits leaves the
+            # file (and its mtime, which keys the parsed-events cache) untouched
+            if updated_event_data != original_event:
+                self.events[event_idx] = updated_event_data
+                self.save_events()
             
             # Build success message
             changes_made = self._build_changes_list(event_without_images, updated_event_data, coordinates_updated)
@@ -203,7 +209,7 @@ class EventManager:
             for img in images:
                 local_path = img.get('local_path', '')
                 if local_path:
-                    img_file = Path("data") / local_path
+                    img_file = DATA_DIR / local_path
                     if img_file.exists():
                         img_file.unlink()
             
@@ -224,7 +230,7 @@ class EventManager:
             event_idx (int): Index of the event to update
             checked (bool): New checked status
         """
-        if event_idx < len(self.events):
+        if event_idx < len(self.events) and self.events[event_idx].get('checked', False) != checked:
             self.events[event_idx]['checked'] = checked
             self.save_events()
     
@@ -278,7 +284,7 @@ class EventManager:
                 f.write(uploaded_file.getbuffer())
             
             # Create image object
-            local_path = str(file_path.relative_to(Path("data")))
+            local_path = str(file_path.relative_to(DATA_DIR))
             img_obj = create_image_object(local_path, filename, "", source_credit)
             
             # Add to images list and sort
@@ -326,7 +332,7 @@ class EventManager:
             
             if local_path:
                 # Try the exact path from JSON
-                img_file = Path("data") / local_path
+                img_file = DATA_DIR / local_path
                 if img_file.exists() and img_file.is_file():
                     try:
                         img_file.unlink()
@@ -342,7 +348,7 @@ class EventManager:
                     path_parts = Path(local_path).parts
                     if len(path_parts) >= 2:
                         # Try to find images directory
-                        images_dir = Path("data") / path_parts[0] / path_parts[1] / "images"
+                        images_dir = DATA_DIR / path_parts[0] / path_parts[1] / "images"
                         if images_dir.exists():
                             # Try exact filename match
                             exact_match = images_dir / filename
@@ -508,9 +514,15 @@ class EventManager:
                 return False, "Image index out of range"
             
             # Update metadata
+            changed = False
             for key, value in updated_metadata.items():
-                if key in images[img_idx]:
+                if key in images[img_idx] and images[img_idx][key] != value:
                     images[img_idx][key] = value
+                    changed = True
+            
+            # Saving the form without edits leaves the events file untouched
+            if not changed:
+                return True, "Image metadata unchanged"
             
             # Update event and save
             event['images'] = images
@@ -665,7 +677,7 @@ class EventManager:
             first_img = images[0]
             local_path = first_img.get('local_path', '')
             if local_path:
-                return Path("data") / Path(local_path).parent
+                return DATA_DIR / Path(local_path).parent
         
         # Create images folder in the same directory as the JSON file
         json_dir = self.file_path.parent
@@ -706,7 +718,7 @@ class EventManager:
             
             # Update image object
             img['filename'] = new_filename
-            img['local_path'] = str(new_path.relative_to(Path("data")))
+            img['local_path'] = str(new_path.relative_to(DATA_DIR))
     
     def _swap_image_files(self, save_dir: Path, old_thumb: str, old_selected: str, 
                          new_thumb: str, new_selected: str, thumb_idx: int, 
@@ -24,7 +24,8 @@ Key Features:
 Dependencies:
 - pathlib: File path operations
 - datetime: Date and time operations
-- json: JSON data handling
+- json: JSON data handling (orjson is used instead when installed)
+- os: Directory scanning (os.scandir)
 - re: Regular expressions for text processing
 - typing: Type hints and annotations
 
@@ -38,14 +39,21 @@ Example Usage:
     pagination = calculate_pagination(100, 10, 0)
 """
 
+import os
 import re
 import json
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, date, time
 from typing import List, Dict, Tuple, Optional, Any, Union
 
 from src.ui.constants import EVENTS_OUTPUT_DIR, MAX_IMAGES_PER_EVENT
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Image Index Management Functions
 def extract_image_index(filename: str) -> int:
@@ -146,10 +154,12 @@ def find_timestamp_folders(base_dir: Union[str, Path]) -> List[Path]:
         # Returns: [Path("2024-01-15_143000"), Path("2024-01-14_120000")]
     """
     base = Path(base_dir)
-    timestamp_folders = []
-    for folder in base.glob("*/"):
-        if folder.is_dir():
-            timestamp_folders.append(folder)
+    if not base.is_dir():
+        return []
+    # DirEntry.is_dir() uses the type from the directory listing, so no
+    # per-entry stat is needed (unlike Path.glob + Path.is_dir)
+    with os.scandir(base) as entries:
+        timestamp_folders = [Path(entry.path) for entry in entries if entry.is_dir()]
     return sorted(timestamp_folders, reverse=True)  # Sort newest first
 
 
@@ -172,19 +182,17 @@ def find_json_files_in_timestamp(timestamp_folder: Path) -> List[Path]:
         # Returns: [Path("relevant/blog1.json"), Path("non-relevant/blog1.json")]
     """
     json_files = []
-    # Check root folder first
-    for json_file in timestamp_folder.glob("*.json"):
-        json_files.append(json_file)
-    # Check 'relevant' subfolder (where relevant JSONs are saved)
-    relevant_folder = timestamp_folder / "relevant"
-    if relevant_folder.exists() and relevant_folder.is_dir():
-        for json_file in relevant_folder.glob("*.json"):
-            json_files.append(json_file)
-    # Check 'non-relevant' subfolder (where non-relevant JSONs are saved)
-    nonrelevant_folder = timestamp_folder / "non-relevant"
-    if nonrelevant_folder.exists() and nonrelevant_folder.is_dir():
-        for json_file in nonrelevant_folder.glob("*.json"):
-            json_files.append(json_file)
+    # Check the root folder, then 'relevant' and 'non-relevant' subfolders
+    # (where relevant / non-relevant JSONs are saved). A single scandir pass per
+    # folder gives names and entry types without extra stat calls.
+    for folder in (timestamp_folder, timestamp_folder / "relevant", timestamp_folder / "non-relevant"):
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        json_files.append(Path(entry.path))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
     # Sort with relevant files first, then non-relevant, then root folder files
     def sort_key(p: Path) -> tuple:
         if p.parent.name == 'relevant':
@@ -243,7 +251,10 @@ def load_events_from_file(file_path: Path) -> List[Dict]:
         # Returns: [{'title': 'Event 1', ...}, {'title': 'Event 2', ...}]
     """
     try:
-        events = json.loads(file_path.read_text(encoding="utf-8"))
+        if orjson is not None:
+            events = orjson.loads(file_path.read_bytes())
+        else:
+            events = json.loads(file_path.read_text(encoding="utf-8"))
         if not isinstance(events, list):
             raise ValueError("JSON file does not contain a list of events.")
         
@@ -266,7 +277,8 @@ def save_events_to_file(events: List[Dict], file_path: Path) -> None:
     Save events to JSON file.
     
     Writes a list of event dictionaries to a JSON file with proper
-    formatting and UTF-8 encoding. Also normalizes keyword_tag to ensure
+    formatting and UTF-8 encoding. The file is replaced atomically via a
+    temporary sibling file. Also normalizes keyword_tag to ensure
     it's saved as a comma-separated string, not an array.
     
     Args:
@@ -286,7 +298,43 @@ def save_events_to_file(events: List[Dict], file_path: Path) -> None:
             elif not isinstance(keyword_tag, str):
                 event['keyword_tag'] = str(keyword_tag) if keyword_tag else ''
     
-    file_path.write_text(json.dumps(events, indent=2, ensure_ascii=False), encoding="utf-8")
+    if orjson is not None:
+        # Same 2-space, UTF-8 output as the json fallback, encoded straight to bytes
+        data = orjson.dumps(events, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(events, indent=2, ensure_ascii=False).encode("utf-8")
+    
+    # Write next to the target and swap it in, so an interrupted save never
+    # leaves a truncated events file behind
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def format_json_text(value: Any) -> str:
+    """
+    Pretty-print a JSON value for display/editing in a text area.
+    
+    Produces the same 2-space indented, non-ASCII-preserving text as
+    json.dumps(value, indent=2, ensure_ascii=False), using orjson when installed.
+    
+    Args:
+        value (Any): JSON-serializable value (typically a list or dict field)
+        
+    Returns:
+        str: Indented JSON text
+        
+    Example:
+        format_json_text({"a": [1, 2]})
+        # Returns: '{\n  "a": [\n    1,\n    2\n  ]\n}'
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(value, indent=2, ensure_ascii=False)
 
 
 # DateTime Handling Functions
@@ -317,42 +365,44 @@ def parse_iso_datetime(iso_string: str) -> Tuple[Optional[date], Optional[time]]
         # Returns: (date(2024, 1, 15), time(14, 30, 0))
         
         parse_iso_datetime("2024-01-15")
-        # Returns: (date(2024, 1, 15), None)
+        # Returns: (date(2024, 1, 15), time(0, 0))
     """
     if not iso_string or not isinstance(iso_string, str):
         return None, None
     
+    return _parse_iso_datetime_cached(iso_string)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime_cached(iso_string: str) -> Tuple[Optional[date], Optional[time]]:
+    """
+    Memoized body of parse_iso_datetime for non-empty strings.
+    
+    The form re-parses every visible event's start/end datetimes on each
+    rerun; the strings rarely change and the results are immutable, so each
+    distinct string is parsed once.
+    """
+    iso_string = iso_string.strip()
+    
     try:
-        # Handle various ISO 8601 formats
-        iso_string = iso_string.strip()
-        
-        # Remove timezone info for parsing (Z or +XX:XX format)
+        # fromisoformat handles date-only strings, fractional seconds and
+        # +HH:MM / -HH:MM offsets; a trailing 'Z' is spelled out for Pythons
+        # before 3.11. time() drops the offset, keeping the wall-clock time
+        # as written.
         if iso_string.endswith('Z'):
-            iso_string = iso_string[:-1]
-        elif '+' in iso_string[-6:] or iso_string.count('-') > 2:
-            # Remove timezone offset like +08:00 or +0800
-            if '+' in iso_string:
-                iso_string = iso_string.split('+')[0]
-            elif iso_string.count('-') > 2:  # More than 2 dashes means timezone
-                parts = iso_string.split('-')
-                iso_string = '-'.join(parts[:3]) + 'T' + parts[3].split('T')[1] if 'T' in iso_string else '-'.join(parts[:3])
-        
-        # Parse the datetime
-        if 'T' in iso_string:
-            dt = datetime.fromisoformat(iso_string)
-        else:
-            # If no time component, assume it's just a date
-            dt = datetime.strptime(iso_string, '%Y-%m-%d')
-        
+            iso_string = iso_string[:-1] + '+00:00'
+        dt = datetime.fromisoformat(iso_string)
         return dt.date(), dt.time()
     
-    except (ValueError, AttributeError, IndexError):
-        # If parsing fails, try to extract just the date
+    except ValueError:
+        # fromisoformat rejects unpadded dates such as "2024-1-5"; a bare date
+        # still parses to midnight, and a malformed datetime keeps its date only
         try:
-            date_part = iso_string.split('T')[0] if 'T' in iso_string else iso_string
-            dt = datetime.strptime(date_part, '%Y-%m-%d')
-            return dt.date(), None
-        except:
+            if 'T' in iso_string:
+                return datetime.strptime(iso_string.split('T')[0], '%Y-%m-%d').date(), None
+            dt = datetime.strptime(iso_string, '%Y-%m-%d')
+            return dt.date(), dt.time()
+        except ValueError:
             return None, None
 
 
@@ -390,6 +440,7 @@ def combine_to_iso_datetime(date_obj: date, time_obj: time) -> Optional[str]:
 
 
 # Image Display Functions
+@lru_cache(maxsize=None)
 def get_image_display_params(aspect_ratio: str, base_width: int = 1000) -> Dict[str, Any]:
     """
     Calculate image display parameters based on selected aspect ratio.
@@ -398,6 +449,9 @@ def get_image_display_params(aspect_ratio: str, base_width: int = 1000) -> Dict[
     Supports "Original", "4:3", and "16:9" ratios with appropriate CSS styling
     for consistent display across the application.
     
+    Results are memoized per (aspect_ratio, base_width), so every image on a
+    rerun shares one dict; callers must treat it as read-only.
+    
     Args:
         aspect_ratio (str): Selected aspect ratio ("Original", "4:3", "16:9")
         base_width (int): Base width for image display calculations
@@ -405,6 +459,7 @@ def get_image_display_params(aspect_ratio: str, base_width: int = 1000) -> Dict[
     Returns:
         dict: Dictionary with CSS style and streamlit parameters containing:
             - width: Image width in pixels
+            - height: Image height in pixels, or None to keep the original ratio
             - use_container_width: Whether to use container width
             - css_style: CSS styling for aspect ratio control
             
@@ -412,6 +467,7 @@ def get_image_display_params(aspect_ratio: str, base_width: int = 1000) -> Dict[
         params = get_image_display_params("16:9", 1000)
         # Returns: {
         #     'width': 1000,
+        #     'height': 562,
         #     'use_container_width': False,
         #     'css_style': 'width: 1000px; height: 562px; object-fit: cover;'
         # }
@@ -421,6 +477,7 @@ def get_image_display_params(aspect_ratio: str, base_width: int = 1000) -> Dict[
         height = int(base_width * 3 / 4)
         return {
             "width": base_width,
+            "height": height,
             "use_container_width": False,
             "css_style": f"width: {base_width}px; height: {height}px; object-fit: cover;"
         }
@@ -429,12 +486,14 @@ def get_image_display_params(aspect_ratio: str, base_width: int = 1000) -> Dict[
         height = int(base_width * 9 / 16)
         return {
             "width": base_width,
+            "height": height,
             "use_container_width": False,
             "css_style": f"width: {base_width}px; height: {height}px; object-fit: cover;"
         }
     else:  # Original
         return {
             "width": base_width,
+            "height": None,
             "use_container_width": False,
             "css_style": None
         }
@@ -595,7 +654,29 @@ def calculate_pagination(total_items: int, items_per_page: int, current_page: in
     }
 
 
-def search_events_by_title(events: List[Dict], search_term: str, case_sensitive: bool = False) -> List[Tuple[int, Dict]]:
+def build_title_search_index(events: List[Dict]) -> List[str]:
+    """
+    Build the lowercased title of every event, for case-insensitive search.
+    
+    Build it once per loaded file and pass it to search_events_by_title /
+    filter_events_by_search, so titles are not re-lowercased on every rerun
+    (i.e. every keystroke in the search box).
+    
+    Args:
+        events (List[Dict]): List of event dictionaries
+        
+    Returns:
+        List[str]: Lowercased titles, in the same order as events ('' if missing)
+        
+    Example:
+        build_title_search_index([{'title': 'Art Workshop'}, {}])
+        # Returns: ['art workshop', '']
+    """
+    return [(event.get('title') or '').lower() for event in events]
+
+
+def search_events_by_title(events: List[Dict], search_term: str, case_sensitive: bool = False,
+                           title_index: Optional[List[str]] = None) -> List[Tuple[int, Dict]]:
     """
     Search events by title and return matching events with their indices.
     
@@ -606,6 +687,8 @@ def search_events_by_title(events: List[Dict], search_term: str, case_sensitive:
         events (List[Dict]): List of event dictionaries
         search_term (str): Search term to look for in event titles
         case_sensitive (bool): Whether the search should be case sensitive
+        title_index (Optional[List[str]]): Output of build_title_search_index(events),
+            used for case-insensitive searches instead of lowercasing each title
         
     Returns:
         List[Tuple[int, Dict]]: List of tuples containing (event_index, event_dict) for matching events
@@ -627,6 +710,9 @@ def search_events_by_title(events: List[Dict], search_term: str, case_sensitive:
     
     if not case_sensitive:
         search_term_clean = search_term_clean.lower()
+        if title_index is not None:
+            return [(idx, events[idx]) for idx, title in enumerate(title_index)
+                    if title and search_term_clean in title]
     
     for idx, event in enumerate(events):
         title = event.get('title', '')
@@ -642,7 +728,8 @@ def search_events_by_title(events: List[Dict], search_term: str, case_sensitive:
     return matching_events
 
 
-def filter_events_by_search(events: List[Dict], search_term: str, case_sensitive: bool = False) -> List[Dict]:
+def filter_events_by_search(events: List[Dict], search_term: str, case_sensitive: bool = False,
+                            title_index: Optional[List[str]] = None) -> List[Dict]:
     """
     Filter events by search term and return only matching events.
     
@@ -654,6 +741,7 @@ def filter_events_by_search(events: List[Dict], search_term: str, case_sensitive
         events (List[Dict]): List of event dictionaries
         search_term (str): Search term to look for in event titles
         case_sensitive (bool): Whether the search should be case sensitive
+        title_index (Optional[List[str]]): Output of build_title_search_index(events)
         
     Returns:
         List[Dict]: List of events that match the search criteria
@@ -670,5 +758,5 @@ def filter_events_by_search(events: List[Dict], search_term: str, case_sensitive
     if not search_term.strip():
         return events  # Return all events if search term is empty
     
-    matching_indices = [idx for idx, _ in search_events_by_title(events, search_term, case_sensitive)]
+    matching_indices = [idx for idx, _ in search_events_by_title(events, search_term, case_sensitive, title_index)]
     return [events[idx] for idx in matching_indices] 
\ No newline at end of file
@@ -15,11 +15,12 @@ sys.path.insert(0, str(root_path))
 
 from src.ui.constants import (
     STREAMLIT_PAGE_CONFIG, DEFAULT_EVENTS_PER_PAGE,
-    DEFAULT_ASPECT_RATIO, MAX_IMAGES_PER_EVENT, SUPPORTED_IMAGE_TYPES
+    DEFAULT_ASPECT_RATIO, MAX_IMAGES_PER_EVENT, SUPPORTED_IMAGE_TYPES,
+    FOLDER_LISTING_TTL_SECONDS, DATA_DIR, EMAILS_FILE
 )
 from src.ui.helpers import (
     find_timestamp_folders, find_json_files_in_timestamp, load_events_from_file,
-    calculate_pagination
+    calculate_pagination, build_title_search_index, format_json_text
 )
 from src.ui.components import (
     render_aspect_ratio_selector, render_event_header, render_event_form,
@@ -29,6 +30,32 @@ from src.ui.components import (
 from src.ui.event_manager import EventManager
 
 
+# Streamlit reruns the whole script on every widget interaction; these cached
+# wrappers keep directory scans and JSON parsing out of that per-click path.
+@st.cache_data(ttl=FOLDER_LISTING_TTL_SECONDS, show_spinner=False)
+def cached_timestamp_folders(base_dir: Path) -> List[Path]:
+    """find_timestamp_folders, re-scanned at most once per FOLDER_LISTING_TTL_SECONDS."""
+    return find_timestamp_folders(base_dir)
+
+
+@st.cache_data(ttl=FOLDER_LISTING_TTL_SECONDS, show_spinner=False)
+def cached_json_files_in_timestamp(timestamp_folder: Path) -> List[Path]:
+    """find_json_files_in_timestamp, re-scanned at most once per FOLDER_LISTING_TTL_SECONDS."""
+    return find_json_files_in_timestamp(timestamp_folder)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_events_from_file(file_path: Path, file_mtime: float) -> List[Dict]:
+    """
+    Parse a JSON file once per version.
+    
+    file_mtime is only part of the cache key, so saving the file (which bumps
+    its mtime) makes the next call re-read it. Each call returns a fresh copy,
+    so callers may mutate the events freely.
+    """
+    return load_events_from_file(file_path)
+
+
 def initialize_session_state():
     """Initialize session state variables."""
     if 'deleted_image_slot' not in st.session_state:
@@ -86,7 +113,7 @@ def confirm_delete_image(event_manager: EventManager, event_idx: int, img_idx: i
     # Safely derive a local file path only when a real relative path is present
     local_rel = (img_obj.get("local_path") or "").strip() if isinstance(img_obj, dict) else ""
     if local_rel:
-        img_file = Path("data") / local_rel
+        img_file = DATA_DIR / local_rel
         if img_file.is_file():
             try:
                 current_aspect_ratio = st.session_state.get('aspect_ratio', DEFAULT_ASPECT_RATIO)
@@ -140,7 +167,7 @@ def render_image_section(event_manager: EventManager, event: Dict, event_idx: in
             success, message = event_manager.add_image_to_event(event_idx, uploaded_file)
             if success:
                 st.success(f"✅ {message} to Event {event_idx + 1}!")
-                st.rerun()
+                st.rerun(scope="fragment")
             else:
                 st.error(f"❌ {message}")
     else:
@@ -159,7 +186,7 @@ def render_image_section(event_manager: EventManager, event: Dict, event_idx: in
 
             img_source = None
             if local_rel:
-                candidate = Path("data") / local_rel
+                candidate = DATA_DIR / local_rel
                 if candidate.is_file():
                     img_source = str(candidate)
 
@@ -199,7 +226,7 @@ def render_image_section(event_manager: EventManager, event: Dict, event_idx: in
                         success, message = event_manager.swap_with_thumbnail(event_idx, img_idx)
                         if success:
                             st.success(f"✅ {message}")
-                            st.rerun()
+                            st.rerun(scope="fragment")
                         else:
                             st.error(f"❌ {message}")
                 
@@ -224,7 +251,7 @@ def render_image_section(event_manager: EventManager, event: Dict, event_idx: in
             success, message = event_manager.add_image_to_event(event_idx, additional_file)
             if success:
                 st.success(f"✅ {message} to Event {event_idx + 1}!")
-                st.rerun()
+                st.rerun(scope="fragment")
             else:
                 st.error(f"❌ {message}")
 
@@ -296,10 +323,9 @@ def render_image_metadata_form(event_manager: EventManager, event_idx: int, img_
                         key=f"img_{key}_{event_idx}_{img_idx}"
                     )
                 else:
-                    import json
                     metadata_updates[key] = st.text_area(
                         key.replace('_', ' ').title(),
-                        value=json.dumps(value, indent=2, ensure_ascii=False) if value else "",
+                        value=format_json_text(value) if value else "",
                         height=60,
                         key=f"img_{key}_{event_idx}_{img_idx}"
                     )
@@ -311,18 +337,70 @@ def render_image_metadata_form(event_manager: EventManager, event_idx: int, img_
                 # Get the current image file path
                 current_local_path = img_obj.get('local_path', '')
                 if current_local_path:
-                    image_file_path = Path("data") / current_local_path
+                    image_file_path = DATA_DIR / current_local_path
                     # Overwrite the file with the new uploaded file
                     image_file_path.write_bytes(new_img_file.getbuffer())
             
             success, message = event_manager.update_image_metadata(event_idx, img_idx, metadata_updates)
             if success:
                 st.success(f"✅ {message}")
-                st.rerun()
+                st.rerun(scope="fragment")
             else:
                 st.error(f"❌ {message}")
 
 
+@st.fragment
+def render_event(event_manager: EventManager, event_idx: int):
+    """
+    Render one event's header, form and images.
+    
+    Running as a fragment, edits to this event (checkbox, form save, image
+    upload/metadata/thumbnail) rerun only this block instead of the whole
+    page. The event is re-read from the manager on every run, since edits
+    replace the event dict. Deleting an event changes the list itself, so the
+    confirmation dialog still reruns the full app.
+    """
+    event = event_manager.events[event_idx]
+    
+    # Use unique ID for form keys to prevent collisions
+    unique_id = event.get('_unique_id', f"event_{event_idx}")
+    
+    # Event header with checkbox and delete button
+    current_checked = event.get('checked', False)
+    new_checked, delete_requested = render_event_header(event_idx, current_checked)
+    
+    # Update checked status if changed
+    if new_checked != current_checked:
+        event_manager.update_event_checked_status(event_idx, new_checked)
+        st.rerun(scope="fragment")
+    
+    # Handle delete request
+    if delete_requested:
+        confirm_delete_event(event_manager, event_idx, event)
+    
+    # Show form and images only for unchecked events
+    if not new_checked:
+        # Event form - use unique ID for form keys
+        form_data = render_event_form(event, unique_id)
+        if form_data:
+            success, message = event_manager.update_event(event_idx, form_data)
+            if success:
+                st.session_state[f'success_message_{unique_id}'] = message
+                st.rerun(scope="fragment")
+            else:
+                st.error(f"❌ {message}")
+        
+        # Show success message
+        render_success_message(unique_id)
+        
+        # Image management section. Images are off by default and only loaded
+        # and rendered once the toggle is switched on; the choice is kept per
+        # event, and switching it reruns just this event's fragment.
+        image_count = len(event.get("images", []))
+        if st.toggle(f"🖼️ Show images ({image_count})", value=False, key=f"show_images_{unique_id}"):
+            render_image_section(event_manager, event, event_idx)
+
+
 def get_events_output_dir() -> Path:
     """Parse command line arguments to get events output directory."""
     parser = argparse.ArgumentParser(description='Event JSON & Image Editor')
@@ -352,7 +430,7 @@ def main():
     st.info(f"📁 Events directory: {events_output_dir.absolute()}")
     
     # Add download link for emails Excel file if it exists
-    emails_file = Path("data/emails.xlsx")
+    emails_file = EMAILS_FILE
     if emails_file.exists():
         emails_data = emails_file.read_bytes()
         st.download_button(
@@ -366,7 +444,7 @@ def main():
     st.divider()
     
     # 1. Select timestamp folder and aspect ratio
-    timestamp_folders = find_timestamp_folders(events_output_dir)
+    timestamp_folders = cached_timestamp_folders(events_output_dir)
     if not timestamp_folders:
         st.warning(f"No timestamp folders found in {events_output_dir}.")
         st.stop()
@@ -387,7 +465,7 @@ def main():
         )
     
     # 2. Select JSON file within the selected timestamp folder
-    json_files_in_timestamp = find_json_files_in_timestamp(selected_timestamp_folder)
+    json_files_in_timestamp = cached_json_files_in_timestamp(selected_timestamp_folder)
     if not json_files_in_timestamp:
         st.warning(f"No JSON files found in folder {selected_timestamp_folder.name}.")
         st.stop()
@@ -412,7 +490,7 @@ def main():
             st.session_state['current_file'] != selected_file or
             file_mtime != cached_mtime):
             # Load events from file
-            events = load_events_from_file(selected_file)
+            events = cached_events_from_file(selected_file, file_mtime)
             
             # Add unique IDs to events if they don't have them
             for i, event in enumerate(events):
@@ -435,8 +513,14 @@ def main():
     search_term = st.session_state.get('search_term', '')
     case_sensitive = st.session_state.get('case_sensitive_search', False)
     
+    # Lowercased titles are built once per loaded file version, not per keystroke
+    cached_index = st.session_state.get('title_search_index')
+    if cached_index is None or cached_index[0] != session_key:
+        cached_index = (session_key, build_title_search_index(events))
+        st.session_state['title_search_index'] = cached_index
+    
     new_search_term, new_case_sensitive, filtered_events = render_search_section(
-        events, search_term, case_sensitive
+        events, search_term, case_sensitive, cached_index[1]
     )
     
     # Update session state if search parameters changed
@@ -464,17 +548,17 @@ def main():
     end_idx = pagination_info['end_idx']
     current_page_events = filtered_events[start_idx:end_idx]
     
-    for page_event_idx, event in enumerate(current_page_events):
-        # Calculate actual event index in the full unfiltered events list
-        # Find the original index of this event in the full events list
-        try:
-            original_event_idx = events.index(event)
-        except ValueError:
-            # If event not found (shouldn't happen), use a fallback
-            original_event_idx = start_idx + page_event_idx
-        
-        # Use unique ID for form keys to prevent collisions
-        unique_id = event.get('_unique_id', f"event_{original_event_idx}")
+    # Map page events back to their index in the full list by identity:
+    # events.index() compared whole event dicts against every earlier event,
+    # and without a search the page slice indexes the full list directly
+    if filtered_events is events:
+        original_indexes = range(start_idx, end_idx)
+    else:
+        index_by_id = {id(event): idx for idx, event in enumerate(events)}
+        original_indexes = [index_by_id.get(id(event), start_idx + page_event_idx)
+                            for page_event_idx, event in enumerate(current_page_events)]
+    
+    for event, original_event_idx in zip(current_page_events, original_indexes):
         
         # Event separator
         st.markdown(
@@ -491,36 +575,7 @@ def main():
             unsafe_allow_html=True
         )
         
-        # Event header with checkbox and delete button
-        current_checked = event.get('checked', False)
-        new_checked, delete_requested = render_event_header(original_event_idx, current_checked)
-        
-        # Update checked status if changed
-        if new_checked != current_checked:
-            event_manager.update_event_checked_status(original_event_idx, new_checked)
-            st.rerun()
-        
-        # Handle delete request
-        if delete_requested:
-            confirm_delete_event(event_manager, original_event_idx, event)
-        
-        # Show form and images only for unchecked events
-        if not new_checked:
-            # Event form - use unique ID for form keys
-            form_data = render_event_form(event, unique_id)
-            if form_data:
-                success, message = event_manager.update_event(original_event_idx, form_data)
-                if success:
-                    st.session_state[f'success_message_{unique_id}'] = message
-                    st.rerun()
-                else:
-                    st.error(f"❌ {message}")
-            
-            # Show success message
-            render_success_message(unique_id)
-            
-            # Image management section
-            render_image_section(event_manager, event, original_event_idx)
+        render_event(event_manager, original_event_idx)
 
 
 if __name__ == "__main__":
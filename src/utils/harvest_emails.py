@@ -1,7 +1,9 @@
 import json
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 try:
     import openpyxl
@@ -9,12 +11,15 @@ try:
 except ImportError:
     openpyxl = None
 
-from src.services.page_emails import scrape_event_emails
+from src.services.page_emails import SharedBrowser, scrape_event_emails
 
 OUTPUT_XLSX = Path("data/emails.xlsx")
 
 COLUMNS = ["url", "organiser", "email", "source_json"]
 
+# Event pages scraped at once; each worker thread keeps its own browser
+HARVEST_WORKERS = 5
+
 
 def load_existing_urls(xlsx_path: Path) -> set:
     if not xlsx_path.exists() or openpyxl is None:
@@ -74,7 +79,7 @@ def iter_events_in_folder(folder: Path) -> List[Dict[str, Any]]:
     return events
 
 
-def harvest(folder_path: str, use_playwright: bool = True) -> None:
+def harvest(folder_path: str, use_playwright: bool = True, cdp_url: Optional[str] = None) -> None:
     folder = Path(folder_path)
     if not folder.exists() or not folder.is_dir():
         print(f"Invalid folder: {folder}")
@@ -89,11 +94,11 @@ def harvest(folder_path: str, use_playwright: bool = True) -> None:
     ws = wb.active
 
     events = iter_events_in_folder(folder)
-    added = 0
     skipped = 0
 
-    total = len(events)
-    for i, ev in enumerate(events):
+    # Pick the URLs to scrape first, in file order, each at most once
+    to_scrape = []
+    for ev in events:
         url = (ev.get("url") or ev.get("event_url") or "").strip()
         organiser = (ev.get("organiser") or ev.get("organizer") or ev.get("organiser_name") or "").strip()
         src = ev.get("__source_json", "")
@@ -102,20 +107,52 @@ def harvest(folder_path: str, use_playwright: bool = True) -> None:
         if url in existing_urls:
             skipped += 1
             continue
-
-        # Show progress
-        print(f"  [{i+1}/{total}] Scraping: {url[:60]}...")
-        
-        emails = scrape_event_emails(url, use_js=use_playwright)
+        existing_urls.add(url)
+        to_scrape.append((url, organiser, src))
+
+    total = len(to_scrape)
+    work: queue.Queue = queue.Queue()
+    for i, item in enumerate(to_scrape):
+        work.put((i, item[0], 0))
+    results: List[List[str]] = [[] for _ in to_scrape]
+
+    def _worker() -> None:
+        # Playwright's sync API is bound to the thread that started it, so each
+        # worker owns one browser (or CDP connection) and reuses it for all of
+        # its JS fallbacks
+        with SharedBrowser(cdp_url) as browser:
+            while True:
+                try:
+                    i, url, attempt = work.get_nowait()
+                except queue.Empty:
+                    return
+                print(f"  [{i+1}/{total}] Scraping: {url[:60]}...")
+                try:
+                    results[i] = scrape_event_emails(url, use_js=use_playwright, browser=browser)
+                except Exception as e:
+                    print(f"    ✗ Failed to scrape {url[:60]}: {e}")
+                if browser.is_disconnected():
+                    # A crashed browser or dropped CDP connection would make every
+                    # later JS fetch come back empty; start a fresh one and give
+                    # this URL one more try
+                    print(f"    ↻ Browser disconnected while scraping {url[:60]}; restarting it")
+                    browser.restart()
+                    if attempt == 0:
+                        work.put((i, url, attempt + 1))
+
+    # Bounded pool: pages are scraped concurrently, but never more than
+    # HARVEST_WORKERS browsers (and live pages) at once
+    with ThreadPoolExecutor(max_workers=HARVEST_WORKERS) as executor:
+        for future in [executor.submit(_worker) for _ in range(min(HARVEST_WORKERS, total))]:
+            future.result()
+
+    for (url, organiser, src), emails in zip(to_scrape, results):
         # Join all emails with comma (instead of just taking first one)
         email_str = ", ".join(emails) if emails else ""
-        
         if emails:
-            print(f"    ✓ Found {len(emails)} email(s): {email_str}")
-
+            print(f"    ✓ Found {len(emails)} email(s) for {url[:60]}: {email_str}")
         ws.append([url, organiser, email_str, src])
-        existing_urls.add(url)
-        added += 1
+    added = len(to_scrape)
 
     OUTPUT_XLSX.parent.mkdir(parents=True, exist_ok=True)
     wb.save(OUTPUT_XLSX)
@@ -124,10 +161,19 @@ def harvest(folder_path: str, use_playwright: bool = True) -> None:
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python -m src.utils.harvest_emails <events_output_folder> [--no-playwright]")
+        print("Usage: python -m src.utils.harvest_emails <events_output_folder> [--no-playwright] [--cdp-url URL]")
+        print("  --cdp-url  reuse a running Chromium, e.g. one started with:")
+        print("             chromium --headless=new --remote-debugging-port=9222")
+        print("             and passed as --cdp-url http://localhost:9222")
         sys.exit(1)
     folder = sys.argv[1]
-    use_pw = True
-    if len(sys.argv) > 2 and sys.argv[2] == "--no-playwright":
-        use_pw = False
-    harvest(folder, use_playwright=use_pw)
+    options = sys.argv[2:]
+    use_pw = "--no-playwright" not in options
+    cdp_url = None
+    if "--cdp-url" in options:
+        index = options.index("--cdp-url")
+        if index + 1 >= len(options):
+            print("--cdp-url requires a URL")
+            sys.exit(1)
+        cdp_url = options[index + 1]
+    harvest(folder, use_playwright=use_pw, cdp_url=cdp_url)
@@ -6,6 +6,13 @@ import json
 
 from src.utils.config import config
 
+# Tabs/newlines become spaces; other control characters (except \r) are dropped
+_CLEAN_TEXT_TABLE = str.maketrans({
+    '\t': ' ',
+    '\n': ' ',
+    **{chr(code): None for code in (*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F)},
+})
+
 def simple_text_to_id(text: str) -> str:
     """Convert text to a simple numeric id by summing character values"""
     return str(sum(ord(c) for c in text) % 10000000)  # Keep it to 7 digits
@@ -77,11 +84,9 @@ def clean_text(text: str) -> str:
     # First replace escaped characters
     text = text.replace('\\t', ' ').replace('\\n', ' ')
     
-    # Then replace actual tab and newline characters
-    text = text.replace('\t', ' ').replace('\n', ' ')
-    
-    # Remove a wider range of control characters except for common whitespace
-    text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+    # Then replace actual tab and newline characters and remove a wider range
+    # of control characters except for common whitespace, in a single pass
+    text = text.translate(_CLEAN_TEXT_TABLE)
     
     # Replace multiple spaces with a single space and strip
     text = re.sub(r'\s+', ' ', text).strip()
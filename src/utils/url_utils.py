@@ -1,3 +1,4 @@
+import re
 import requests
 import logging
 from fake_useragent import UserAgent
@@ -7,6 +8,18 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 # If you want to disable logging for cleaner output during testing, uncomment the next line:
 logging.getLogger().setLevel(logging.CRITICAL) 
 
+# Page text suggesting a 403/429/503 comes from bot protection rather than a dead URL
+BLOCKING_INDICATORS_RE = re.compile(
+    r"cloudflare|captcha|bot protection|access denied|blocked|forbidden|rate limit"
+    r"|please enable javascript|robot|security check|ddos protection",
+    re.I,
+)
+# Page text marking a 2xx response as a soft 404
+SOFT_404_INDICATORS_RE = re.compile(
+    r"page not found|error 404|not found|this page does not exist|page unavailable|resource not found",
+    re.I,
+)
+
 def validate_url(url: str, timeout: int = 10) -> bool:
     """
     Check if a URL is valid and accessible, handling bot protection and other common blockers.
@@ -79,25 +92,12 @@ def validate_url(url: str, timeout: int = 10) -> bool:
             if response.status_code == 404:
                 return False
             elif response.status_code in [403, 429, 503]:
-                blocking_indicators = [
-                    'cloudflare', 'captcha', 'bot protection', 'access denied',
-                    'blocked', 'forbidden', 'rate limit', 'please enable javascript',
-                    'robot', 'security check', 'ddos protection'
-                ]
-                content_lower = content_snippet.lower()
-                
-                if any(indicator in content_lower for indicator in blocking_indicators):
+                if BLOCKING_INDICATORS_RE.search(content_snippet):
                     return True  # URL exists but is protected - consider it valid
                 else:
                     return False
             elif 200 <= response.status_code < 300: # Successful responses (2xx)
-                soft_404_indicators = [
-                    'page not found', 'error 404', 'not found',
-                    'this page does not exist', 'page unavailable', 'resource not found'
-                ]
-                content_lower = content_snippet.lower()
-                
-                if any(indicator in content_lower for indicator in soft_404_indicators):
+                if SOFT_404_INDICATORS_RE.search(content_snippet):
                     return False  # Soft 404
                 else:
                     return True  # Genuine 200 response
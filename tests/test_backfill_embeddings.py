@@ -0,0 +1,92 @@
+import importlib.util
+import sys
+import threading
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+for _dependency in ("mysql.connector", "numpy", "torch", "dotenv", "sentence_transformers", "tqdm"):
+    pytest.importorskip(_dependency)
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "Scripts" / "backfill_embeddings.py"
+
+
+def load_script():
+    spec = importlib.util.spec_from_file_location("backfill_embeddings", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_connection():
+    """Connection whose cursor counts zero events and streams no rows."""
+    conn = mock.MagicMock()
+    conn.cursor.return_value.fetchone.return_value = [0]
+    conn.cursor.return_value.fetchmany.return_value = []
+    return conn
+
+
+def run_main(module, timeout=10):
+    """Run module.main() in a thread and return what it raised; fail if it hangs."""
+    outcome = {}
+
+    def target():
+        try:
+            module.main()
+        except BaseException as exc:
+            outcome["error"] = exc
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "main() hung after a pipeline stage failed to connect"
+    return outcome.get("error")
+
+
+@pytest.mark.parametrize("failing_stage", ["fetch_stage", "write_stage"])
+def test_main_raises_when_stage_cannot_connect(failing_stage):
+    module = load_script()
+    error = ConnectionError("MySQL unreachable")
+
+    def connect(**_config):
+        # Only the chosen pipeline stage fails; main() and the other stage connect
+        if sys._getframe(1).f_code.co_name == failing_stage:
+            raise error
+        return make_connection()
+
+    with mock.patch.object(module, "load_model", return_value=(mock.MagicMock(), "cpu")), \
+            mock.patch.object(module.mysql, "connect", connect):
+        raised = run_main(module)
+
+    assert raised is error
+
+
+def test_writer_failure_stops_encoding_early():
+    module = load_script()
+    error = RuntimeError("upsert failed")
+    available_batches = 100
+    row = (1, "Title", "Blurb", "Description", None, None)
+
+    fetch_conn = make_connection()
+    fetch_conn.cursor.return_value.fetchmany.side_effect = [[row]] * available_batches + [[]]
+    write_conn = make_connection()
+    write_conn.cursor.return_value.executemany.side_effect = error
+
+    def connect(**_config):
+        caller = sys._getframe(1).f_code.co_name
+        if caller == "fetch_stage":
+            return fetch_conn
+        if caller == "write_stage":
+            return write_conn
+        return make_connection()
+
+    model = mock.MagicMock()
+    with mock.patch.object(module, "load_model", return_value=(model, "cpu")), \
+            mock.patch.object(module.mysql, "connect", connect):
+        raised = run_main(module)
+
+    assert raised is error
+    # Only batches already queued or in flight may be encoded after the failure
+    assert model.encode.call_count <= 2 * module.PIPELINE_QUEUE_SIZE + 2
+    assert fetch_conn.cursor.return_value.fetchmany.call_count < available_batches
@@ -0,0 +1,34 @@
+import io
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+pytest.importorskip("streamlit")
+
+from src.ui.components import load_display_image
+
+
+def decoded_size(image_bytes):
+    with Image.open(io.BytesIO(image_bytes)) as img:
+        return img.size
+
+
+def test_portrait_is_limited_by_width_only(tmp_path):
+    image_path = tmp_path / "portrait.jpg"
+    Image.new("RGB", (2000, 6000), "white").save(image_path)
+
+    image_bytes, mime_type = load_display_image(str(image_path), image_path.stat().st_mtime, 1000)
+
+    assert mime_type == "image/jpeg"
+    assert decoded_size(image_bytes) == (1000, 3000)
+
+
+def test_exif_orientation_is_applied(tmp_path):
+    image_path = tmp_path / "rotated.jpg"
+    exif = Image.Exif()
+    exif[0x0112] = 6  # Orientation: rotate 90 degrees clockwise to display
+    Image.new("RGB", (300, 100), "white").save(image_path, exif=exif)
+
+    image_bytes, _ = load_display_image(str(image_path), image_path.stat().st_mtime, 1000)
+
+    assert decoded_size(image_bytes) == (100, 300)
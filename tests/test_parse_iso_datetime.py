@@ -0,0 +1,24 @@
+from datetime import date, time
+
+import pytest
+
+pytest.importorskip("streamlit")
+
+from src.ui.helpers import parse_iso_datetime
+
+
+@pytest.mark.parametrize(
+    "iso_string, expected",
+    [
+        ("2024-01-15", (date(2024, 1, 15), time(0, 0))),
+        ("2024-1-5", (date(2024, 1, 5), time(0, 0))),
+        ("2024-01-15T14:30:00", (date(2024, 1, 15), time(14, 30))),
+        ("2024-01-02T03:04:05Z", (date(2024, 1, 2), time(3, 4, 5))),
+        ("2024-01-02T03:04:05-05:00", (date(2024, 1, 2), time(3, 4, 5))),
+        ("2024-01-02T25:00", (date(2024, 1, 2), None)),
+        ("not a date", (None, None)),
+        ("", (None, None)),
+    ],
+)
+def test_parse_iso_datetime(iso_string, expected):
+    assert parse_iso_datetime(iso_string) == expected